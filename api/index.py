@@ -2,12 +2,14 @@ import sys
 import os
 
 # Adiciona o diretório 'backend' ao path do Python para que 'app.main' seja encontrado
-sys.path.append(os.path.join(os.path.dirname(__file__), '../backend'))
+_BACKEND = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
 
 try:
     from app.main import app
-except Exception as e:
+except Exception:
     import traceback
     print("CRITICAL ERROR DURING STARTUP:")
     traceback.print_exc()
-    raise e
+    raise
@@ -0,0 +1,27 @@
+"""add project version column
+
+Revision ID: 4e7a2c91d0b3
+Revises: cb8f161b6e0d
+Create Date: 2026-10-15 10:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '4e7a2c91d0b3'
+down_revision = 'cb8f161b6e0d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Optimistic locking counter; existing rows start at 0
+    op.add_column(
+        'projetos',
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('projetos', 'version')
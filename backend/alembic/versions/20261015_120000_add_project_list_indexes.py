@@ -0,0 +1,57 @@
+"""add partial indexes for project list and overdue queries
+
+Revision ID: 7b1d4f2a9c60
+Revises: 4e7a2c91d0b3
+Create Date: 2026-10-15 12:00:00.000000
+
+Targets the predicates SQLAlchemyProjectRepository actually issues:
+
+- list / count (GET /projects):
+    WHERE deleted_at IS NULL [AND status = ?] [AND cliente_id = ?] ORDER BY id
+- overdue (GET /projects/analytics/overdue):
+    WHERE deleted_at IS NULL AND status = 'EM_ANDAMENTO' AND data_fim_prevista < ?
+
+Keyset pagination (WHERE id > ? ORDER BY id) is already served by the
+primary key in either direction, and responsavel_id keeps its FK index.
+
+status stays a key column instead of a literal in the WHERE clause:
+Enum(ProjectStatus) stores member names, and on MySQL (no partial
+indexes, postgresql_where is ignored) the key column is what narrows
+the scan.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '7b1d4f2a9c60'
+down_revision = '4e7a2c91d0b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction (PostgreSQL); InnoDB
+    # builds secondary indexes online and ignores the postgresql_* options
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_projetos_live_status_cliente',
+            'projetos',
+            ['status', 'cliente_id', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('deleted_at IS NULL')
+        )
+        op.create_index(
+            'ix_projetos_live_overdue',
+            'projetos',
+            ['status', 'data_fim_prevista'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('deleted_at IS NULL')
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_projetos_live_overdue', table_name='projetos', postgresql_concurrently=True)
+        op.drop_index('ix_projetos_live_status_cliente', table_name='projetos', postgresql_concurrently=True)
@@ -0,0 +1,57 @@
+"""add trigram indexes for user autocomplete search
+
+Revision ID: 2f8c6a1e5d47
+Revises: 7b1d4f2a9c60
+Create Date: 2026-10-15 14:00:00.000000
+
+GET /users/search matches name ILIKE '%q%' OR email ILIKE '%q%'. A
+leading wildcard can't use a B-tree, so on PostgreSQL both columns get a
+pg_trgm GIN index, which serves (I)LIKE '%q%' directly without changing
+the query.
+
+MySQL has no equivalent for infix LIKE (FULLTEXT/ngram would change the
+matching semantics), so this migration is a no-op there; autocomplete
+bursts are absorbed by the 30s result cache instead.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2f8c6a1e5d47'
+down_revision = '7b1d4f2a9c60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_usuarios_name_trgm',
+            'usuarios',
+            ['name'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        )
+        op.create_index(
+            'ix_usuarios_email_trgm',
+            'usuarios',
+            ['email'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_usuarios_email_trgm', table_name='usuarios', postgresql_concurrently=True)
+        op.drop_index('ix_usuarios_name_trgm', table_name='usuarios', postgresql_concurrently=True)
@@ -0,0 +1,50 @@
+"""add partial index for per-client project reads
+
+Revision ID: 5a9e3b7c2d18
+Revises: 2f8c6a1e5d47
+Create Date: 2026-10-15 16:00:00.000000
+
+Completes the index plan for the IProjectRepository read methods:
+
+- get_active_projects:
+    WHERE deleted_at IS NULL AND status = ? ORDER BY id
+    -> ix_projetos_live_status_cliente (status, cliente_id, id) [7b1d4f2a9c60]
+- get_overdue_projects:
+    WHERE deleted_at IS NULL AND status = ? AND data_fim_prevista < ?
+    -> ix_projetos_live_overdue (status, data_fim_prevista) [7b1d4f2a9c60]
+- get_by_client:
+    WHERE deleted_at IS NULL AND cliente_id = ? ORDER BY id
+    -> ix_projetos_live_cliente (cliente_id, id) [this revision]
+
+get_by_client had only the plain cliente_id FK index, which also covers
+soft-deleted rows and leaves the ORDER BY id to a sort. No INCLUDE
+columns: the repository loads whole entities, so an index-only scan is
+never possible and covering columns would only grow the index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5a9e3b7c2d18'
+down_revision = '2f8c6a1e5d47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction (PostgreSQL); InnoDB
+    # builds secondary indexes online and ignores the postgresql_* options
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_projetos_live_cliente',
+            'projetos',
+            ['cliente_id', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text('deleted_at IS NULL')
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_projetos_live_cliente', table_name='projetos', postgresql_concurrently=True)
@@ -19,8 +19,9 @@ Análise de Queries Críticas:
    ✅ status (já existe - partial index)
    ✅ cliente_id (já existe - foreign key)
    ✅ id (primary key - já otimizado)
-   🆕 (deleted_at, status, id) - índice composto para queries filtradas
-   🆕 (cliente_id, status, deleted_at) - filtragem por cliente
+   🆕 (status, id) INCLUDE (cliente_id, responsavel_id, nome, data_fim_prevista)
+      WHERE deleted_at IS NULL - covering index para cursor pagination
+   🆕 (cliente_id, status) WHERE deleted_at IS NULL - filtragem por cliente
 
 2. Projetos Atrasados (GET /projects/overdue)
    - WHERE status = 'em_andamento'
@@ -28,7 +29,7 @@ Análise de Queries Críticas:
    - AND deleted_at IS NULL
    
    Índices necessários:
-   🆕 (status, data_fim_prevista, deleted_at) - covering index
+   🆕 (status, data_fim_prevista) WHERE deleted_at IS NULL - covering index
 
 3. Check-ins Ativos (GET /checkins/active)
    - WHERE status = 'em_andamento'
@@ -37,8 +38,11 @@ Análise de Queries Críticas:
    - ORDER BY data_inicio DESC
    
    Índices necessários:
-   🆕 (usuario_id, status, deleted_at, data_inicio DESC)
-   🆕 (projeto_id, status, deleted_at) - para filtrar por projeto
+   🆕 (usuario_id, status, data_inicio DESC) WHERE deleted_at IS NULL
+   🆕 (usuario_id) INCLUDE (projeto_id, data_inicio, id)
+      WHERE status = 'em_andamento' AND deleted_at IS NULL - check-in ativo
+   🆕 (projeto_id, data_inicio DESC) WHERE deleted_at IS NULL - para filtrar por projeto
+   🆕 BRIN (data_inicio) WHERE deleted_at IS NULL - range scans de analytics
 
 4. Busca de Usuários por Email (POST /auth/login)
    - WHERE email = 'user@example.com'
@@ -46,7 +50,8 @@ Análise de Queries Críticas:
    
    Índices necessários:
    ✅ email (unique - já existe)
-   🆕 (email, deleted_at) - partial index para soft deletes
+   🆕 (email) INCLUDE (id, name, hashed_password, role, is_active)
+      WHERE deleted_at IS NULL - partial UNIQUE covering index para login
 
 5. Tasks por Projeto (GET /projects/{id}/tasks)
    - WHERE projeto_id = X
@@ -54,7 +59,7 @@ Análise de Queries Críticas:
    - ORDER BY ordem
    
    Índices necessários:
-   🆕 (projeto_id, deleted_at, ordem) - covering index
+   🆕 (projeto_id, ordem) WHERE deleted_at IS NULL - covering index
 
 Performance Impact:
 ===================
@@ -84,30 +89,53 @@ def upgrade():
     Add performance indexes.
     
     Strategy: Covering indexes for most common query patterns.
+    
+    Soft-deleted rows are never queried, so every index is partial
+    (WHERE deleted_at IS NULL) instead of carrying deleted_at as a key
+    column. `postgresql_where` is dialect-scoped: on MySQL, which has no
+    partial indexes, the same call emits the plain index on the key columns.
+    
+    Indexes are built with CREATE INDEX CONCURRENTLY so writes on the
+    tables keep flowing during the build. CONCURRENTLY cannot run inside a
+    transaction block, so the statements must run under
+    `op.get_context().autocommit_block()`. MySQL ignores
+    `postgresql_concurrently`; InnoDB already builds secondary indexes
+    online (ALGORITHM=INPLACE, LOCK=NONE).
     """
     pass
+    # with op.get_context().autocommit_block():
+    #     ... op.create_index(...) calls below ...
+    
     # ========================================
     # PROJETOS - Performance Indexes
     # ========================================
     
-    # Composite index for filtered project lists (DELETE + STATUS + ID)
+    # Covering index for filtered project lists (STATUS + ID, INCLUDE list columns)
     # Covers: WHERE deleted_at IS NULL AND status = X ORDER BY id
+    # INCLUDE (PostgreSQL >= 11) carries the list projection in the leaf pages,
+    # so cursor pagination is an Index-Only Scan with no heap fetches.
     # op.create_index(
     #     'idx_projetos_active_status_id',
     #     'projetos',
-    #     ['deleted_at', 'status', 'id'],
+    #     ['status', 'id'],
     #     unique=False,
-    #     postgresql_where=sa.text('deleted_at IS NULL'),  # Partial index (PostgreSQL)
-    #     mysql_length={'deleted_at': None, 'status': 20, 'id': None}  # MySQL length hints
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_include=['cliente_id', 'responsavel_id', 'nome', 'data_fim_prevista'],
+    #     postgresql_where=sa.text('deleted_at IS NULL')  # Partial index (PostgreSQL)
     # )
     
-    # Composite index for client filtering (CLIENT + STATUS + DELETED)
+    # Composite index for client filtering (CLIENT + STATUS)
     # Covers: WHERE cliente_id = X AND status = Y AND deleted_at IS NULL
+    # Selective FK leads; low-cardinality status (3-5 values) goes last.
     # op.create_index(
     #     'idx_projetos_client_status',
     #     'projetos',
-    #     ['cliente_id', 'status', 'deleted_at'],
-    #     unique=False
+    #     ['cliente_id', 'status'],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
     # Covering index for overdue projects
@@ -115,19 +143,16 @@ def upgrade():
     # op.create_index(
     #     'idx_projetos_overdue',
     #     'projetos',
-    #     ['status', 'data_fim_prevista', 'deleted_at'],
+    #     ['status', 'data_fim_prevista'],
     #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
     #     postgresql_where=sa.text("status = 'em_andamento' AND deleted_at IS NULL")
     # )
     
-    # Index for responsible user filtering
-    # Covers: WHERE responsavel_id = X AND deleted_at IS NULL
-    # op.create_index(
-    #     'idx_projetos_responsavel_active',
-    #     'projetos',
-    #     ['responsavel_id', 'deleted_at', 'status'],
-    #     unique=False
-    # )
+    # Responsible user filtering (WHERE responsavel_id = X) is already served
+    # by the single-column FK index ix_projetos_responsavel_id; a composite
+    # copy only adds write amplification on every projetos INSERT/UPDATE.
     
     # ========================================
     # CHECKINS - Performance Indexes
@@ -135,11 +160,31 @@ def upgrade():
     
     # Composite index for user's active check-ins
     # Covers: WHERE usuario_id = X AND status = 'em_andamento' AND deleted_at IS NULL
+    #         ORDER BY data_inicio DESC
     # op.create_index(
     #     'idx_checkins_user_status',
     #     'checkins',
-    #     ['usuario_id', 'status', 'deleted_at', 'data_inicio'],
-    #     unique=False
+    #     ['usuario_id', 'status', sa.text('data_inicio DESC')],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
+    # )
+    
+    # Narrow covering index for the single active check-in per user
+    # Covers: GET /checkins/active
+    #         WHERE usuario_id = X AND status = 'em_andamento' AND deleted_at IS NULL
+    # The constant predicate keeps only in-progress rows (a tiny fraction of
+    # the table), so the lookup is one Index-Only Scan probe.
+    # op.create_index(
+    #     'idx_checkins_active_by_user',
+    #     'checkins',
+    #     ['usuario_id'],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_include=['projeto_id', 'data_inicio', 'id'],
+    #     postgresql_where=sa.text("status = 'em_andamento' AND deleted_at IS NULL")
     # )
     
     # Composite index for project's check-ins
@@ -147,30 +192,48 @@ def upgrade():
     # op.create_index(
     #     'idx_checkins_project_date',
     #     'checkins',
-    #     ['projeto_id', 'deleted_at', 'data_inicio'],
-    #     unique=False
+    #     ['projeto_id', sa.text('data_inicio DESC')],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
-    # Index for date range queries (analytics)
+    # BRIN index for date range queries (analytics)
     # Covers: WHERE data_inicio BETWEEN X AND Y AND deleted_at IS NULL
-    # op.create_index(
-    #     'idx_checkins_date_range',
-    #     'checkins',
-    #     ['data_inicio', 'data_fim', 'deleted_at'],
-    #     unique=False
-    # )
+    # data_inicio grows with insertion order, so a BRIN summary is a few
+    # pages instead of a full B-tree (PostgreSQL only; MySQL keeps using
+    # ix_checkins_data_inicio).
+    # if op.get_context().dialect.name == 'postgresql':
+    #     op.create_index(
+    #         'idx_checkins_brin_date',
+    #         'checkins',
+    #         ['data_inicio'],
+    #         unique=False,
+    #         if_not_exists=True,
+    #         postgresql_concurrently=True,
+    #         postgresql_using='brin',
+    #         postgresql_where=sa.text('deleted_at IS NULL')
+    #     )
     
     # ========================================
     # USUARIOS - Performance Indexes
     # ========================================
     
-    # Partial index for active users lookup by email
+    # Partial UNIQUE index for active users lookup by email
     # Covers: WHERE email = X AND deleted_at IS NULL (login query)
+    # INCLUDE holds every column the login SELECT projects, so login is an
+    # Index-Only Scan (EXPLAIN (ANALYZE, BUFFERS) should show Heap Fetches: 0).
+    # UNIQUE bounds the probe to one tuple; being partial, uniqueness applies
+    # only to non-deleted rows, so a soft-deleted user's email can be reused.
     # op.create_index(
     #     'idx_usuarios_email_active',
     #     'usuarios',
-    #     ['email', 'deleted_at'],
-    #     unique=False,
+    #     ['email'],
+    #     unique=True,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_include=['id', 'name', 'hashed_password', 'role', 'is_active'],
     #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
@@ -179,8 +242,11 @@ def upgrade():
     # op.create_index(
     #     'idx_usuarios_role_active',
     #     'usuarios',
-    #     ['role', 'is_active', 'deleted_at'],
-    #     unique=False
+    #     ['role', 'is_active'],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
     # ========================================
@@ -192,8 +258,11 @@ def upgrade():
     # op.create_index(
     #     'idx_tarefas_project_order',
     #     'tarefas',
-    #     ['projeto_id', 'deleted_at', 'ordem'],
-    #     unique=False
+    #     ['projeto_id', 'ordem'],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
     # ========================================
@@ -205,10 +274,26 @@ def upgrade():
     # op.create_index(
     #     'idx_clientes_active_name',
     #     'clientes',
-    #     ['deleted_at', 'nome'],
-    #     unique=False
+    #     ['nome'],
+    #     unique=False,
+    #     if_not_exists=True,
+    #     postgresql_concurrently=True,
+    #     postgresql_where=sa.text('deleted_at IS NULL')
     # )
     
+    # ========================================
+    # Planner statistics
+    # ========================================
+    
+    # Refresh statistics so the planner picks the new indexes on the first
+    # query after deploy instead of waiting for autovacuum/auto-analyze.
+    # (VACUUM (ANALYZE) for very large tables must run outside the migration.)
+    # if op.get_context().dialect.name == 'postgresql':
+    #     for table in ('projetos', 'checkins', 'usuarios', 'tarefas', 'clientes'):
+    #         op.execute(f"ANALYZE {table}")
+    # else:
+    #     op.execute("ANALYZE TABLE projetos, checkins, usuarios, tarefas, clientes")
+    
     print("✅ Performance indexes created successfully!")
     print("📊 Run ANALYZE/OPTIMIZE TABLE to update statistics")
     print("⚠️  Monitor index usage with:")
@@ -224,17 +309,17 @@ def downgrade():
     Only use in emergency (e.g., index corruption).
     """
     pass
-    # Drop all indexes in reverse order
-    # op.drop_index('idx_clientes_active_name', table_name='clientes')
-    # op.drop_index('idx_tarefas_project_order', table_name='tarefas')
-    # op.drop_index('idx_usuarios_role_active', table_name='usuarios')
-    # op.drop_index('idx_usuarios_email_active', table_name='usuarios')
-    # op.drop_index('idx_checkins_date_range', table_name='checkins')
-    # op.drop_index('idx_checkins_project_date', table_name='checkins')
-    # op.drop_index('idx_checkins_user_status', table_name='checkins')
-    # op.drop_index('idx_projetos_responsavel_active', table_name='projetos')
-    # op.drop_index('idx_projetos_overdue', table_name='projetos')
-    # op.drop_index('idx_projetos_client_status', table_name='projetos')
-    # op.drop_index('idx_projetos_active_status_id', table_name='projetos')
+    # Drop all indexes in reverse order (inside autocommit_block, see upgrade)
+    # op.drop_index('idx_clientes_active_name', table_name='clientes', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_tarefas_project_order', table_name='tarefas', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_usuarios_role_active', table_name='usuarios', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_usuarios_email_active', table_name='usuarios', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_checkins_brin_date', table_name='checkins', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_checkins_project_date', table_name='checkins', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_checkins_active_by_user', table_name='checkins', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_checkins_user_status', table_name='checkins', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_projetos_overdue', table_name='projetos', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_projetos_client_status', table_name='projetos', if_exists=True, postgresql_concurrently=True)
+    # op.drop_index('idx_projetos_active_status_id', table_name='projetos', if_exists=True, postgresql_concurrently=True)
     
     print("⚠️  Performance indexes removed - queries will be SLOW!")
@@ -1,32 +1,79 @@
 """
 API dependencies for authentication and authorization
 """
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Any, Dict, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.core.security import verify_token, get_user_id_from_token, get_user_role_from_token
+from app.core.security import (
+    verify_token,
+    get_user_id_from_token,
+    get_user_id_from_payload
+)
 from app.models.user import User, UserRole
 from app.core.exceptions import unauthorized
+from app.core.logging import user_id_ctx_var
 
 # Security scheme
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+def active_user_by_id_stmt(user_id: int):
+    """
+    Build the active-user lookup used by the auth hot path.
+    
+    `lambda_stmt` caches the constructed statement (and its compiled SQL)
+    across requests; `user_id` is extracted as a bound parameter.
+    """
+    return lambda_stmt(
+        lambda: select(User).where(
+            User.id == user_id,
+            User.is_active.is_(True),
+            User.deleted_at.is_(None)
+        )
+    )
+
+
+def get_token_claims(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
+    """
+    Verify the bearer token once per request.
+    
+    The decoded claims are memoized on `request.state`, so the HMAC
+    signature check runs a single time no matter how many auth
+    dependencies (or middleware) ask for them.
+    """
+    claims = getattr(request.state, "_jwt_claims", None)
+    if claims is None:
+        claims = verify_token(credentials.credentials)
+        request.state._jwt_claims = claims
+    return claims
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: Request,
+    claims: Dict[str, Any] = Depends(get_token_claims),
     db: Session = Depends(get_db)
 ) -> User:
-    """Get current authenticated user."""
-    token = credentials.credentials
-    user_id = get_user_id_from_token(token)
+    """
+    Get current authenticated user.
+    
+    The resolved user is cached on `request.state` so that independent
+    dependency trees (and middleware) in the same request share a single
+    lookup instead of each issuing its own SELECT.
+    """
+    cached_user = getattr(request.state, "_current_user", None)
+    if cached_user is not None:
+        return cached_user
+    
+    user_id = get_user_id_from_payload(claims)
     
-    user = db.query(User).filter(
-        User.id == user_id,
-        User.is_active == True,
-        User.deleted_at.is_(None)
-    ).first()
+    user = db.execute(active_user_by_id_stmt(user_id)).scalars().first()
     
     if not user:
         raise HTTPException(
@@ -35,41 +82,56 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    request.state._current_user = user
+    request.state.user_id = user.id
+    # Correlate the rest of this request's logs with the user (the request
+    # runs in its own copied context, see RequestIDMiddleware)
+    user_id_ctx_var.set(str(user.id))
     return user
 
 
-async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
-    """Get current active user."""
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Usuário inativo"
-        )
-    return current_user
+# get_current_user only loads users with is_active = True (inactive users get
+# its 401), so a separate "active" dependency frame would re-check nothing.
+# Kept as an alias so routers can keep depending on the familiar name.
+get_current_active_user = get_current_user
 
 
 async def require_admin(
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    db: Session = Depends(get_db)
 ) -> User:
-    """Require admin role."""
+    """
+    Require admin role.
+    
+    Tokens whose role claim is not admin are rejected before the user
+    SELECT; the stored role is still checked in case it changed after
+    the token was issued.
+    """
+    if claims.get("role") != UserRole.ADMIN.value:
+        raise unauthorized()
+    current_user = await get_current_user(request, claims, db)
     if not current_user.is_admin:
         raise unauthorized()
     return current_user
 
 
 async def require_supervisor_or_admin(
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    db: Session = Depends(get_db)
 ) -> User:
-    """Require supervisor or admin role."""
+    """Require supervisor or admin role (token role claim checked first, as in require_admin)."""
+    if claims.get("role") not in (UserRole.SUPERVISOR.value, UserRole.ADMIN.value):
+        raise unauthorized()
+    current_user = await get_current_user(request, claims, db)
     if not (current_user.is_supervisor or current_user.is_admin):
         raise unauthorized()
     return current_user
 
 
 async def require_tecnico_or_higher(
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_user)
 ) -> User:
     """Require tecnico, supervisor or admin role."""
     if current_user.role not in [UserRole.TECNICO, UserRole.SUPERVISOR, UserRole.ADMIN]:
@@ -78,23 +140,21 @@ async def require_tecnico_or_higher(
 
 
 def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
-    """Get optional authenticated user (for endpoints that work with or without auth)."""
-    if not credentials:
+    """
+    Get optional authenticated user (for endpoints that work with or without auth).
+    
+    Invalid or non-bearer tokens resolve to None without touching the
+    database; database errors are not swallowed.
+    """
+    if not credentials or credentials.scheme.lower() != "bearer":
         return None
     
     try:
-        token = credentials.credentials
-        user_id = get_user_id_from_token(token)
-        
-        user = db.query(User).filter(
-            User.id == user_id,
-            User.is_active == True,
-            User.deleted_at.is_(None)
-        ).first()
-        
-        return user
-    except:
-        return None
\ No newline at end of file
+        user_id = get_user_id_from_token(credentials.credentials)
+    except (HTTPException, ValueError):
+        return None
+    
+    return db.execute(active_user_by_id_stmt(user_id)).scalars().first()
\ No newline at end of file
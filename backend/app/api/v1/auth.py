@@ -5,15 +5,17 @@ from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_active_user, get_db
+from app.api.deps import active_user_by_id_stmt, get_current_active_user, get_db
 from app.core.config import settings
 from app.core.security import (
     create_access_token, 
     create_refresh_token,
-    verify_password,
-    hash_password,
+    averify_password,
+    ahash_password,
     verify_token
 )
 from app.core.logging import get_logger
@@ -34,6 +36,23 @@ security = HTTPBearer()
 logger = get_logger(__name__)
 
 
+def _login_user_stmt(email: str):
+    """Select only the columns the login response needs (cached via lambda_stmt)."""
+    return lambda_stmt(
+        lambda: select(
+            User.id,
+            User.name,
+            User.email,
+            User.role,
+            User.hashed_password
+        ).where(
+            User.email == email,
+            User.is_active.is_(True),
+            User.deleted_at.is_(None)
+        )
+    )
+
+
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: LoginRequest,
@@ -47,18 +66,14 @@ async def login(
     logger.info("login_attempt", email=login_data.email)
     
     # Find user by email
-    user = db.query(User).filter(
-        User.email == login_data.email,
-        User.is_active == True,
-        User.deleted_at.is_(None)
-    ).first()
+    user = db.execute(_login_user_stmt(login_data.email)).first()
     
     # Verify user exists and password is correct
     if not user:
         logger.warning("login_failed_user_not_found", email=login_data.email)
         raise invalid_credentials()
         
-    if not verify_password(login_data.password, user.hashed_password):
+    if not await averify_password(login_data.password, user.hashed_password):
         logger.warning("login_failed_invalid_password", email=login_data.email, user_id=user.id)
         raise invalid_credentials()
     
@@ -115,11 +130,7 @@ async def refresh_token(
             )
         
         # Find user
-        user = db.query(User).filter(
-            User.id == int(user_id),
-            User.is_active == True,
-            User.deleted_at.is_(None)
-        ).first()
+        user = db.execute(active_user_by_id_stmt(int(user_id))).scalars().first()
         
         if not user:
             raise HTTPException(
@@ -160,24 +171,26 @@ async def register(
 ) -> Any:
     """
     Register new user (public endpoint - modify as needed).
-    """
-    # Check if user with email already exists
-    existing_user = db.query(User).filter(User.email == register_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email já cadastrado no sistema"
-        )
     
-    # Create new user
+    Duplicate emails are rejected by the unique constraint on usuarios.email
+    rather than a racy pre-check SELECT.
+    """
     user = User(
         name=register_data.name,
         email=register_data.email,
-        hashed_password=hash_password(register_data.password)
+        hashed_password=await ahash_password(register_data.password)
     )
     
-    db.add(user)
-    db.commit()
+    try:
+        db.add(user)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email já cadastrado no sistema"
+        )
+    
     db.refresh(user)
     
     return user
@@ -206,14 +219,14 @@ async def update_current_user(
     # You can extend this to update other profile fields
     
     # Verify current password
-    if not verify_password(user_update.current_password, current_user.hashed_password):
+    if not await averify_password(user_update.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Senha atual incorreta"
         )
     
     # Update password
-    current_user.hashed_password = hash_password(user_update.new_password)
+    current_user.hashed_password = await ahash_password(user_update.new_password)
     db.commit()
     db.refresh(current_user)
     
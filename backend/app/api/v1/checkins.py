@@ -1,9 +1,11 @@
+import hashlib
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_active_user
 from app.models.user import User
+from app.models.checkin import Checkin
 from app.schemas.checkin import CheckinCreateFull, CheckinResponse, CheckinListResponse, CheckinStart, CheckinStop
 from app.services.checkin_service import CheckinService
 from app.domain.repositories.checkin_repository import CheckinRepository
@@ -37,13 +39,35 @@ async def stop_checkin(
     checkin = await service.stop_checkin(checkin_id, request, current_user.id)
     return checkin
 
+def _active_checkin_etag(user_id: int, checkin: Optional[Checkin]) -> str:
+    """ETag for the active check-in state (changes on start/stop/update)."""
+    if checkin is None:
+        state = f"{user_id}:none"
+    else:
+        state = f"{user_id}:{checkin.id}:{checkin.status}:{checkin.updated_at}"
+    return '"' + hashlib.blake2b(state.encode(), digest_size=8).hexdigest() + '"'
+
 @router.get("/active", response_model=Optional[CheckinResponse])
 async def get_active_checkin(
     *,
+    http_request: Request,
+    response: Response,
     service: CheckinService = Depends(get_checkin_service),
     current_user: User = Depends(get_current_active_user)
 ) -> Optional[CheckinResponse]:
+    """
+    Polled by clients to show "still checked in?" state.
+    
+    Returns an ETag so unchanged polls get a bodiless 304 via If-None-Match.
+    """
     checkin = await service.get_active_checkin(current_user.id)
+    
+    etag = _active_checkin_etag(current_user.id, checkin)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=0"}
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    response.headers.update(cache_headers)
     return checkin
 
 @router.post("/full", response_model=CheckinResponse, status_code=status.HTTP_201_CREATED)
@@ -60,11 +84,10 @@ async def create_full_checkin(
 @router.get("/", response_model=CheckinListResponse)
 async def list_checkins(
     *,
-    page: int = Query(1, ge=1),
+    cursor: Optional[int] = Query(None, description="Last seen check-in ID"),
     size: int = Query(10, ge=1, le=100),
     service: CheckinService = Depends(get_checkin_service),
     current_user: User = Depends(get_current_active_user)
 ):
-    skip = (page - 1) * size
-    checkins = await service.get_history(skip=skip, limit=size)
-    return {"items": checkins, "total": len(checkins)}
\ No newline at end of file
+    checkins, next_cursor = await service.get_history(cursor=cursor, limit=size)
+    return {"items": checkins, "next_cursor": next_cursor}
\ No newline at end of file
@@ -15,34 +15,88 @@ Does NOT:
 - Know about database (that's in repositories)
 - Manipulate domain entities directly (use service methods)
 """
-from typing import List
+import hashlib
+from contextlib import aclosing
+from datetime import date
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
 
 from app.api.deps import get_current_active_user
-from app.models.user import User
+from app.models.user import User, ROLE_ADMIN, ROLE_SUPERVISOR, ROLE_TECNICO
 from app.services.project_service import ProjectService
 from app.services.dependencies import get_project_service
 from app.schemas.project import (
     ProjectCreateRequest,
     ProjectUpdateRequest,
     ProjectStatusTransitionRequest,
+    ProjectBulkTransitionRequest,
+    ProjectBulkTransitionResponse,
     ProjectResponse,
+    ProjectListResponse,
     ProjectStatisticsResponse,
     ContributorAddRequest
 )
 from app.schemas.user import UserResponse
-from app.domain.entities.project import (
-    ProjectStatus,
-    BusinessRuleViolationError,
-    InvalidStateTransitionError
+from app.domain.entities.project import ProjectStatus
+from app.domain.repositories.project_repository import (
+    ProjectAccessDeniedError,
+    RepositoryError
 )
-from app.domain.repositories.project_repository import ProjectNotFoundError
+from app.core.cache import warm_project_cache
 from app.core.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Read-path TTLs (seconds). Keys live in the "projects" namespace under
+# "list:*" / "statistics:*" so ProjectService mutations invalidate them.
+LIST_CACHE_TTL = 30
+# "project:detail:{id}" holds the rendered GET /{id} body; writes re-warm it
+DETAIL_CACHE_TTL = 60
+OVERDUE_CACHE_TTL = 60
+# Streamed overdue lists larger than this are sent but not cached
+OVERDUE_CACHE_MAX_BYTES = 1_000_000
+STATISTICS_CACHE_TTL = 300
+
+# Roles that may change/delete any project; other users only their own
+MANAGE_ANY_PROJECT = ROLE_ADMIN | ROLE_SUPERVISOR
+
+
+def _can_manage(user: User, responsible_user_id: int) -> bool:
+    """Admins and supervisors always; anyone else only on projects they own."""
+    is_owner = responsible_user_id == user.id
+    return bool(user.role_flags & (MANAGE_ANY_PROJECT | ROLE_TECNICO * is_owner))
+
+
+# Built once: pydantic-core serializer for bare project lists
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectResponse])
+
+
+def _render(model) -> bytes:
+    """
+    Serialize DTOs straight to JSON bytes in pydantic-core (by alias).
+    
+    Same output FastAPI would produce, without the intermediate dicts of
+    jsonable_encoder/model_dump; send it with _json_response().
+    """
+    if isinstance(model, list):
+        return _PROJECT_LIST_ADAPTER.dump_json(model, by_alias=True)
+    return model.model_dump_json(by_alias=True)
+
+
+def _json_response(payload: str | bytes) -> Response:
+    """Send pre-encoded JSON as-is (no re-encoding by the response class)."""
+    return Response(content=payload, media_type="application/json")
+
+
+async def _warmed_response(project, status_code: int = status.HTTP_200_OK) -> Response:
+    """Render a just-written project, cache it as its detail body and send it."""
+    payload = _render(ProjectResponse.from_domain(project))
+    await warm_project_cache(project.id, payload, ttl=DETAIL_CACHE_TTL)
+    return Response(content=payload, status_code=status_code, media_type="application/json")
+
 
 # ========================================
 # CRUD Endpoints
@@ -68,50 +122,45 @@ async def create_project(
         400: Business rule violation
         401: Unauthorized
     """
-    try:
-        # Service layer handles business logic
-        project = await service.create_project(
-            name=request.name,
-            description=request.description,
-            start_date=request.start_date,
-            end_date_planned=request.end_date_planned,
-            client_id=request.client_id,
-            responsible_user_id=request.responsible_user_id,
-            estimated_value=request.estimated_value
-        )
-        
-        # Map domain entity to DTO
-        return ProjectResponse.from_domain(project)
-        
-    except BusinessRuleViolationError as e:
-        logger.warning("project_creation_failed", reason=str(e), user_id=current_user.id)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    # Service layer handles business logic; domain errors map to HTTP
+    # statuses in the app-level exception handlers
+    project = await service.create_project(
+        name=request.name,
+        description=request.description,
+        start_date=request.start_date,
+        end_date_planned=request.end_date_planned,
+        client_id=request.client_id,
+        responsible_user_id=request.responsible_user_id,
+        estimated_value=request.estimated_value
+    )
+    
+    # Map domain entity to DTO; the first GET is already a cache hit
+    return await _warmed_response(project, status.HTTP_201_CREATED)
 
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=ProjectListResponse)
 async def list_projects(
     *,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
+    cursor: Optional[int] = Query(None, gt=0, description="Last seen project ID (keyset pagination, overrides skip)"),
     status_filter: ProjectStatus = Query(None, description="Filter by project status"),
     client_id: int = Query(None, gt=0, description="Filter by client ID"),
     service: ProjectService = Depends(get_project_service),
     current_user: User = Depends(get_current_active_user)
-) -> List[ProjectResponse]:
+) -> ProjectListResponse:
     """
     List projects with optional filtering and pagination.
     
     Query Parameters:
     - skip: Pagination offset (default: 0)
-    - limit: Max results per page (default: 100, max: 100)
+    - limit: Max results per page (default: 100, max: 100 - larger values get 422)
+    - cursor: Last seen project ID; pages by keyset instead of OFFSET
     - status_filter: Filter by project status
     - client_id: Filter by client
     
     Returns:
-        200: List of projects
+        200: Page envelope {items, total, skip, limit, next_cursor}
         401: Unauthorized
     """
     # Determine responsible_id filter based on user role
@@ -119,15 +168,35 @@ async def list_projects(
     if current_user.role == "tecnico":
         responsible_id = current_user.id
 
-    projects = service.list_projects(
+    key_source = f"{skip}:{limit}:{cursor}:{status_filter}:{client_id}:{responsible_id}"
+    cache_key = f"list:{hashlib.sha1(key_source.encode()).hexdigest()}"
+    cached = await service.cache.get_raw(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    filters = dict(status=status_filter, client_id=client_id, responsible_id=responsible_id)
+    if cursor is not None:
+        # Keyset page: deep pages cost the same as the first one
+        projects, next_cursor = await service.list_projects_cursor(cursor=cursor, limit=limit, **filters)
+        total = await service.count_projects(**filters)
+        skip = 0
+    else:
+        projects, total = await service.list_projects(skip=skip, limit=limit, **filters)
+        has_more = skip + len(projects) < total
+        next_cursor = projects[-1].id if projects and has_more else None
+    
+    # Trusted rows: build DTOs without validation and render once, skipping
+    # FastAPI's response_model re-validation pass (schema still documents it)
+    page = ProjectListResponse.model_construct(
+        items=ProjectResponse.from_domain_list(projects),
+        total=total,
         skip=skip,
         limit=limit,
-        status=status_filter,
-        client_id=client_id,
-        responsible_id=responsible_id
+        next_cursor=next_cursor
     )
-    
-    return [ProjectResponse.from_domain(p) for p in projects]
+    payload = _render(page)
+    await service.cache.set_raw(cache_key, payload, ttl=LIST_CACHE_TTL)
+    return _json_response(payload)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -145,15 +214,10 @@ async def get_project(
         404: Project not found
         401: Unauthorized
     """
-    try:
-        project = await service.get_project(project_id)
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
+    cached = await service.cache.get_raw(f"project:detail:{project_id}")
+    if cached is not None:
+        return _json_response(cached)
+    return await _warmed_response(await service.get_project(project_id))
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -173,31 +237,20 @@ async def update_project(
         200: Project updated successfully
         400: Business rule violation
         404: Project not found
+        409: Project changed since `version` was read
         401: Unauthorized
     """
-    try:
-        project = await service.update_project(
-            project_id=project_id,
-            name=request.name,
-            description=request.description,
-            end_date_planned=request.end_date_planned,
-            observations=request.observations,
-            estimated_value=request.estimated_value
-        )
-        
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except BusinessRuleViolationError as e:
-        logger.warning("project_update_failed", project_id=project_id, reason=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    project = await service.update_project(
+        project_id=project_id,
+        name=request.name,
+        description=request.description,
+        end_date_planned=request.end_date_planned,
+        observations=request.observations,
+        estimated_value=request.estimated_value,
+        expected_version=request.version
+    )
+    
+    return await _warmed_response(project)
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -223,29 +276,31 @@ async def delete_project(
         401: Unauthorized
     """
     # CRITICAL SECURITY FIX: Verify ownership before deletion
-    project = await service.get_project(project_id)
-    
-    # Authorization logic
-    is_admin = current_user.is_admin
-    is_owner = project.responsible_user_id == current_user.id
-    is_supervisor = current_user.is_supervisor
+    role_flags = current_user.role_flags
     
-    can_delete = is_admin or (is_supervisor and is_owner)
-    
-    if not can_delete:
+    def deny() -> HTTPException:
         logger.warning(
             "unauthorized_delete_attempt",
             user_id=current_user.id,
             user_role=current_user.role,
             project_id=project_id
         )
-        raise HTTPException(
+        return HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Você não tem permissão para excluir este projeto"
         )
     
+    if not role_flags & MANAGE_ANY_PROJECT:
+        raise deny()
+    
+    # Supervisors may only delete their own projects; the repository checks
+    # ownership on the locked row, atomically with the delete itself
+    owner_id = None if role_flags & ROLE_ADMIN else current_user.id
+    
     try:
-        deleted = await service.delete_project(project_id=project_id, force=force)
+        deleted = await service.delete_project(
+            project_id=project_id, force=force, owner_id=owner_id
+        )
 
         if not deleted:
             raise HTTPException(
@@ -259,6 +314,8 @@ async def delete_project(
             deleted_by=current_user.id,
             force=force
         )
+    except ProjectAccessDeniedError:
+        raise deny()
     except RepositoryError as e:
         logger.error(
             "project_delete_failed_endpoint",
@@ -276,10 +333,45 @@ async def delete_project(
 # Business Operation Endpoints
 # ========================================
 
+@router.post("/bulk/transition", response_model=ProjectBulkTransitionResponse)
+async def bulk_transition_projects(
+    *,
+    request: ProjectBulkTransitionRequest,
+    service: ProjectService = Depends(get_project_service),
+    current_user: User = Depends(get_current_active_user)
+) -> ProjectBulkTransitionResponse:
+    """
+    Apply start/pause/complete/cancel to many projects in one request.
+    
+    One transaction and one cache invalidation for the whole batch.
+    Same permissions as the single-project endpoints: admins and
+    supervisors may transition any project, other users only the ones
+    they are responsible for (the rest are reported as skipped).
+    
+    Returns:
+        200: {updated: [...], skipped: [...]}
+    """
+    owner_id = None if current_user.role_flags & MANAGE_ANY_PROJECT else current_user.id
+    
+    try:
+        updated, skipped = await service.bulk_transition(
+            request.project_ids, request.action, owner_id
+        )
+    except RepositoryError as e:
+        logger.error("project_bulk_transition_failed_endpoint", action=request.action, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro ao atualizar projetos"
+        )
+    
+    return ProjectBulkTransitionResponse(updated=updated, skipped=skipped)
+
+
 @router.post("/{project_id}/start", response_model=ProjectResponse)
 async def start_project(
     *,
     project_id: int,
+    request: ProjectStatusTransitionRequest = None,
     service: ProjectService = Depends(get_project_service),
     current_user: User = Depends(get_current_active_user)
 ) -> ProjectResponse:
@@ -293,26 +385,21 @@ async def start_project(
         400: Invalid state transition
         404: Project not found
     """
-    try:
-        # Permission check
-        project = await service.get_project(project_id)
-        if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
-             raise HTTPException(status_code=403, detail="Not authorized to update project status")
+    # Permission check
+    project = await service.get_project(project_id)
+    if not _can_manage(current_user, project.responsible_user_id):
+        raise HTTPException(status_code=403, detail="Not authorized to update project status")
 
-        project = await service.start_project(project_id)
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransitionError as e:
-        logger.warning("project_start_failed", project_id=project_id, reason=str(e))
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    expected_version = request.version if request else None
+    project = await service.start_project(project_id, expected_version)
+    return await _warmed_response(project)
 
 
 @router.post("/{project_id}/pause", response_model=ProjectResponse)
 async def pause_project(
     *,
     project_id: int,
+    request: ProjectStatusTransitionRequest = None,
     service: ProjectService = Depends(get_project_service),
     current_user: User = Depends(get_current_active_user)
 ) -> ProjectResponse:
@@ -321,19 +408,14 @@ async def pause_project(
     
     Business Rule: Can only pause EM_ANDAMENTO projects.
     """
-    try:
-        # Permission check
-        project = await service.get_project(project_id)
-        if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
-             raise HTTPException(status_code=403, detail="Not authorized to update project status")
+    # Permission check
+    project = await service.get_project(project_id)
+    if not _can_manage(current_user, project.responsible_user_id):
+        raise HTTPException(status_code=403, detail="Not authorized to update project status")
 
-        project = await service.pause_project(project_id)
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransitionError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    expected_version = request.version if request else None
+    project = await service.pause_project(project_id, expected_version)
+    return await _warmed_response(project)
 
 
 @router.post("/{project_id}/complete", response_model=ProjectResponse)
@@ -349,20 +431,15 @@ async def complete_project(
     
     Business Rule: Can only complete active projects.
     """
-    try:
-        # Permission check
-        project = await service.get_project(project_id)
-        if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
-             raise HTTPException(status_code=403, detail="Not authorized to update project status")
-
-        completion_date = request.completion_date if request else None
-        project = await service.complete_project(project_id, completion_date)
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransitionError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # Permission check
+    project = await service.get_project(project_id)
+    if not _can_manage(current_user, project.responsible_user_id):
+        raise HTTPException(status_code=403, detail="Not authorized to update project status")
+
+    completion_date = request.completion_date if request else None
+    expected_version = request.version if request else None
+    project = await service.complete_project(project_id, completion_date, expected_version)
+    return await _warmed_response(project)
 
 
 @router.post("/{project_id}/cancel", response_model=ProjectResponse)
@@ -378,20 +455,15 @@ async def cancel_project(
     
     Business Rule: Cannot cancel completed projects.
     """
-    try:
-        # Permission check
-        project = await service.get_project(project_id)
-        if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
-             raise HTTPException(status_code=403, detail="Not authorized to update project status")
-
-        reason = request.cancellation_reason if request else None
-        project = await service.cancel_project(project_id, reason)
-        return ProjectResponse.from_domain(project)
-        
-    except ProjectNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransitionError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # Permission check
+    project = await service.get_project(project_id)
+    if not _can_manage(current_user, project.responsible_user_id):
+        raise HTTPException(status_code=403, detail="Not authorized to update project status")
+
+    reason = request.cancellation_reason if request else None
+    expected_version = request.version if request else None
+    project = await service.cancel_project(project_id, reason, expected_version)
+    return await _warmed_response(project)
 
 
 # ========================================
@@ -412,7 +484,13 @@ async def get_project_statistics(
     Returns:
         200: Statistics dictionary
     """
-    stats = service.get_project_statistics()
+    cache_key = "statistics:global"
+    cached = await service.cache.get(cache_key)
+    if cached is not None:
+        return ProjectStatisticsResponse(**cached)
+
+    stats = await service.get_project_statistics()
+    await service.cache.set(cache_key, stats, ttl=STATISTICS_CACHE_TTL)
     return ProjectStatisticsResponse(**stats)
 
 
@@ -427,8 +505,49 @@ async def get_overdue_projects(
     
     Use Case: Alert dashboard, manager notifications
     """
-    projects = service.get_overdue_projects()
-    return [ProjectResponse.from_domain(p) for p in projects]
+    # Overdue depends on today's date, so the day is part of the key
+    cache_key = f"list:overdue:{date.today().isoformat()}"
+    cached = await service.cache.get_raw(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    # Fetch the first batch before the response starts, so a failing query
+    # still becomes an error status instead of a truncated 200 body
+    stream = service.stream_overdue_projects()
+    first_batch = await anext(stream, None)
+
+    async def body():
+        # Incremental JSON array, one chunk per repository batch; the
+        # first rows go out before the rest are loaded. aclosing() closes
+        # the stream (and its DB session) even if the client disconnects.
+        parts: Optional[list] = [b"["]
+        size = 1
+        yield b"["
+        async with aclosing(stream):
+            batch = first_batch
+            first = True
+            while batch is not None:
+                chunk = _render(ProjectResponse.from_domain_list(batch))[1:-1]
+                if not first:
+                    chunk = b"," + chunk
+                first = False
+                yield chunk
+                
+                # Keep a copy for the cache only while it stays small
+                if parts is not None:
+                    size += len(chunk)
+                    if size <= OVERDUE_CACHE_MAX_BYTES:
+                        parts.append(chunk)
+                    else:
+                        parts = None
+                batch = await anext(stream, None)
+        yield b"]"
+        
+        if parts is not None:
+            parts.append(b"]")
+            await service.cache.set_raw(cache_key, b"".join(parts), ttl=OVERDUE_CACHE_TTL)
+
+    return StreamingResponse(body(), media_type="application/json")
 
 
 # ========================================
@@ -454,11 +573,11 @@ async def add_contributor(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
         
-    if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
+    if not _can_manage(current_user, project.responsible_user_id):
         raise HTTPException(status_code=403, detail="Not authorized to manage contributors for this project")
         
     try:
-        service.add_contributor(project_id, request.user_id)
+        await service.add_contributor(project_id, request.user_id)
         return {"message": "Contributor added successfully"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -483,11 +602,11 @@ async def remove_contributor(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
         
-    if not (current_user.is_admin or current_user.is_supervisor) and project.responsible_user_id != current_user.id:
+    if not _can_manage(current_user, project.responsible_user_id):
         raise HTTPException(status_code=403, detail="Not authorized to manage contributors for this project")
         
     try:
-        service.remove_contributor(project_id, user_id)
+        await service.remove_contributor(project_id, user_id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -505,5 +624,5 @@ async def get_contributors(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
         
-    contributors = service.get_contributors(project_id)
+    contributors = await service.get_contributors(project_id)
     return [UserResponse.model_validate(u) for u in contributors]
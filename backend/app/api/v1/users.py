@@ -1,6 +1,7 @@
 """
 User management endpoints
 """
+import asyncio
 from typing import List
 import logging
 from fastapi import APIRouter, Depends, Query
@@ -11,16 +12,20 @@ from app.schemas.common import SearchItemResponse
 from app.services.user_service import UserService
 from app.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
 from app.api.deps import get_current_active_user, require_admin
+from app.core.cache import cache, invalidate_user_search_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Autocomplete fires per keystroke; a short TTL absorbs bursts of typing
+USER_SEARCH_CACHE_TTL = 30
+
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     repository = SQLAlchemyUserRepository(db)
     return UserService(repository)
 
 @router.post("/", response_model=UserResponse)
-def create_user(
+async def create_user(
     user_data: UserCreate,
     service: UserService = Depends(get_user_service),
     current_user = Depends(require_admin)
@@ -29,19 +34,29 @@ def create_user(
     Create a new user. Only admins can perform this action.
     """
     logger.info(f"[USER CREATE] Admin {current_user.email} creating user {user_data.email}")
-    return service.create_user(user_data)
+    user = await asyncio.to_thread(service.create_user, user_data)
+    await invalidate_user_search_cache()
+    return user
+
+@cache(
+    ttl=USER_SEARCH_CACHE_TTL,
+    namespace="users",
+    key_builder=lambda service, q, limit: f"search:{q.lower()}:{limit}"
+)
+async def _search_users(service: UserService, q: str, limit: int) -> list:
+    """Search results as plain dicts (JSON-cacheable); matching is case-insensitive."""
+    users = await asyncio.to_thread(service.search_users, q, limit)
+    logger.info(f"[USER SEARCH] Found {len(users)} users from DB")
+    return [SearchItemResponse(id=u.id, name=u.name, email=u.email).model_dump() for u in users]
 
 @router.get("/search", response_model=List[SearchItemResponse])
-def search_users(
+async def search_users(
     q: str = Query(..., min_length=1),
     limit: int = Query(10, ge=1, le=50),
     service: UserService = Depends(get_user_service),
     current_user = Depends(get_current_active_user)
 ):
     logger.info(f"[USER SEARCH] Query: '{q}', Limit: {limit}")
-    users = service.search_users(q, limit)
-    logger.info(f"[USER SEARCH] Found {len(users)} users from DB")
-    
-    result = [SearchItemResponse(id=u.id, name=u.name, email=u.email) for u in users]
-    logger.info(f"[USER SEARCH] Returning: {[r.model_dump() for r in result]}")
+    result = await _search_users(service, q, limit)
+    logger.info(f"[USER SEARCH] Returning: {result}")
     return result
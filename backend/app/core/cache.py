@@ -18,41 +18,181 @@ Invalidation Strategy:
 - Manual invalidation on write operations (UPDATE/DELETE)
 - Pattern-based invalidation (e.g., clear all "project:*" keys)
 """
-import json
+import asyncio
+import fnmatch
 import hashlib
+from collections import OrderedDict
 from functools import wraps
+from time import monotonic
 from typing import Optional, Any, Callable, Union, List
 from datetime import timedelta
+import pickle
+import orjson
 import redis.asyncio as redis
+from pydantic import BaseModel
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Key hashing for the cache() decorator: BLAKE2b with an 8-byte digest is
+# faster than MD5 in CPython and yields the same 16 hex chars
+_blake2b = hashlib.blake2b
+
+# Pattern invalidation: SCAN with a large COUNT so big keyspaces take few
+# cursor round-trips, UNLINK (Redis >= 4.0, memory freed in a background
+# thread) queued on a non-transactional pipeline flushed every batch. Redis
+# stays responsive between SCAN calls, unlike a server-side script.
+_SCAN_COUNT = 10_000
+_UNLINK_BATCH = 500
+
+
+# One connection pool per process, shared by every CacheService instance
+# (services are built per request). No I/O here: sockets open on first use
+# and are reused afterwards, so requests don't pay a TCP/TLS handshake each.
+_POOL = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    encoding="utf-8",
+    decode_responses=True,
+    socket_timeout=5,
+    socket_connect_timeout=5
+)
+
+
+# Shared client over _POOL, probed once by init_redis() at startup. While
+# None, every default-URL CacheService runs in no-cache mode.
+_shared_client: Optional[redis.Redis] = None
+
+
+# In-flight background SETs from the cache() decorator. The set holds strong
+# references so tasks aren't garbage-collected mid-write; past the cap a miss
+# is simply not stored (the next miss recomputes), so a slow Redis can't
+# pile up unbounded tasks.
+_MAX_PENDING_SETS = 256
+_pending_sets: set[asyncio.Task] = set()
+_skipped_sets = 0
+
+
+# Process-local L1 in front of Redis for get(): namespaced key ->
+# (expires_at, decoded value), LRU-evicted past _L1_MAXSIZE. Other workers'
+# invalidations can't reach it, so entries live at most _L1_MAX_TTL seconds.
+# Only touched from the event loop with no await in between, so no lock.
+_L1_MAXSIZE = 4096
+_L1_MAX_TTL = 5.0
+_l1: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+_l1_stats = {"cache_l1_hit": 0, "cache_l1_miss": 0}
+# Bumped by every invalidation. get() only stores what it read from Redis if
+# no invalidation ran while it was awaiting, so a pre-invalidation value
+# can't be written back into L1.
+_l1_generation = 0
+
+
+def get_l1_stats() -> dict:
+    """Hit/miss counters and current size of the in-process L1 cache."""
+    return {**_l1_stats, "size": len(_l1)}
+
+
+def _l1_discard(*namespaced_keys: str) -> None:
+    global _l1_generation
+    _l1_generation += 1
+    for namespaced_key in namespaced_keys:
+        _l1.pop(namespaced_key, None)
+
+
+def _encode_model(obj: Any) -> Any:
+    # orjson handles dataclasses, dates and enums natively; Pydantic models
+    # go through their JSON-mode dump. Anything else (ORM objects) must fail
+    # loudly rather than be cached as its repr().
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not cacheable: {type(obj).__name__}")
+
+
+class OrjsonCodec:
+    """
+    Default value codec for CacheService.
+    
+    Any replacement needs the same dumps()/loads() pair and must emit UTF-8
+    text: the shared pool decodes responses (decode_responses=True), which
+    rules out binary formats such as msgpack or pickle.
+    """
+    
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_encode_model)
+    
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+_DEFAULT_CODEC = OrjsonCodec()
+
+
+# (namespace, default_ttl) -> CacheService, shared by the decorator, the
+# invalidation helpers and get_cache_service(). Instances bind the shared
+# client at construction, so the memo is reset whenever that changes.
+_svc_cache: dict[tuple[str, int], "CacheService"] = {}
+
+
+async def init_redis() -> bool:
+    """
+    Probe Redis once (call on app startup).
+    
+    Success enables caching for every CacheService on the default URL;
+    failure is logged and the app runs without cache rather than crashing.
+    """
+    global _shared_client
+    _svc_cache.clear()
+    _l1.clear()
+    client = redis.Redis(connection_pool=_POOL)
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.warning("redis_connection_failed_operating_without_cache", error=str(e))
+        _shared_client = None
+        return False
+    _shared_client = client
+    logger.info("redis_connected")
+    return True
+
+
+async def close_redis_pool() -> None:
+    """Close every pooled Redis connection (call once on app shutdown)."""
+    global _shared_client
+    _shared_client = None
+    _svc_cache.clear()
+    _l1.clear()
+    await _POOL.disconnect()
+    logger.info("redis_pool_closed")
+
 
 class CacheService:
     """
     Redis-based cache service with Cache-Aside pattern.
     
     Features:
-    - Automatic serialization/deserialization (JSON)
+    - Automatic serialization/deserialization (JSON via orjson, pluggable codec)
     - Namespace support (avoid key collisions)
     - TTL management
     - Pattern-based invalidation
     - Async/await support
     
     Example:
-        cache = CacheService(namespace="projects")
+        cache = get_cache_service("projects")
         await cache.set("project:1", project_data, ttl=300)
         data = await cache.get("project:1")
-        await cache.invalidate("project:1")
+        first, second = await cache.mget(["project:1", "project:2"])
+        await cache.delete("project:1")
     """
     
     def __init__(
         self,
         redis_url: str = None,
         namespace: str = "app",
-        default_ttl: int = 60
+        default_ttl: int = 60,
+        codec: Any = None
     ):
         """
         Initialize cache service.
@@ -61,36 +201,53 @@ class CacheService:
             redis_url: Redis connection URL (default from settings)
             namespace: Key namespace to avoid collisions
             default_ttl: Default expiration time in seconds
+            codec: Value codec with dumps()/loads() (default: OrjsonCodec)
         """
         self.redis_url = redis_url or settings.REDIS_URL
         self.namespace = namespace
         self.default_ttl = default_ttl
+        self.codec = codec or _DEFAULT_CODEC
         self._client: Optional[redis.Redis] = None
+        self._enabled = False
+        
+        if self.redis_url == settings.REDIS_URL and _shared_client is not None:
+            self._client = _shared_client
+            self._enabled = True
     
     async def connect(self):
-        """Establish Redis connection (lazy initialization)."""
-        if self._client is None:
-            try:
-                # redis.from_url is synchronous in redis-py 5.x
-                self._client = redis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                    socket_timeout=5,
-                    socket_connect_timeout=5
-                )
-                await self._client.ping()
-                logger.info("redis_connected", namespace=self.namespace)
-            except Exception as e:
-                # Log error but don't crash - operate in no-cache mode
-                logger.warning("redis_connection_failed_operating_without_cache", error=str(e))
-                self._client = None
+        """
+        Connect an instance that isn't on the shared pool (custom redis_url).
+        
+        Default-URL instances are bound at construction from init_redis(),
+        so cache operations never connect on the hot path - they only check
+        self._enabled.
+        """
+        if self._enabled:
+            return
+        try:
+            # Ad-hoc URL: private pool (redis.from_url is synchronous)
+            client = redis.from_url(
+                self.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_timeout=5,
+                socket_connect_timeout=5
+            )
+            await client.ping()
+            self._client = client
+            self._enabled = True
+            logger.info("redis_connected", namespace=self.namespace)
+        except Exception as e:
+            # Log error but don't crash - operate in no-cache mode
+            logger.warning("redis_connection_failed_operating_without_cache", error=str(e))
     
     async def disconnect(self):
-        """Close Redis connection gracefully."""
+        """Release this client; the shared pool stays open (see close_redis_pool)."""
         if self._client:
-            await self._client.close()
+            if self._client is not _shared_client:
+                await self._client.close()
             self._client = None
+            self._enabled = False
             logger.info("redis_disconnected", namespace=self.namespace)
     
     def _make_key(self, key: str) -> str:
@@ -106,13 +263,27 @@ class CacheService:
             
         Returns:
             Cached value (deserialized from JSON) or None if not found
+        
+        Hot keys are answered from the in-process L1 for up to
+        min(default_ttl, _L1_MAX_TTL) seconds without touching Redis.
+        The decoded value is shared between callers, so treat it as
+        read-only.
         """
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return None
 
             namespaced_key = self._make_key(key)
+            entry = _l1.get(namespaced_key)
+            if entry is not None:
+                if entry[0] > monotonic():
+                    _l1.move_to_end(namespaced_key)
+                    _l1_stats["cache_l1_hit"] += 1
+                    return entry[1]
+                del _l1[namespaced_key]
+            _l1_stats["cache_l1_miss"] += 1
+            
+            generation = _l1_generation
             value = await self._client.get(namespaced_key)
             
             if value is None:
@@ -120,9 +291,14 @@ class CacheService:
                 return None
             
             logger.debug("cache_hit", key=key)
-            return json.loads(value)
+            decoded = self.codec.loads(value)
+            if generation == _l1_generation:
+                _l1[namespaced_key] = (monotonic() + min(self.default_ttl, _L1_MAX_TTL), decoded)
+                if len(_l1) > _L1_MAXSIZE:
+                    _l1.popitem(last=False)
+            return decoded
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error("cache_deserialize_failed", key=key, error=str(e))
             return None
         except Exception as e:
@@ -147,19 +323,22 @@ class CacheService:
             True if successful, False otherwise
         """
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return False
 
             namespaced_key = self._make_key(key)
             expiration = ttl if ttl is not None else self.default_ttl
+            _l1_discard(namespaced_key)
             
-            serialized = json.dumps(value)
+            serialized = self.codec.dumps(value)
             await self._client.setex(
                 namespaced_key,
                 timedelta(seconds=expiration),
                 serialized
             )
+            # Again once the write landed: a get() that read the old value
+            # after the first discard must not keep it in L1
+            _l1_discard(namespaced_key)
             
             logger.debug("cache_set", key=key, ttl=expiration)
             return True
@@ -171,6 +350,125 @@ class CacheService:
             logger.error("cache_set_failed", key=key, error=str(e))
             return False
     
+    async def get_raw(self, key: str) -> Optional[str]:
+        """
+        Get an already-serialized JSON document without decoding it.
+        
+        For responses that are cached as JSON and sent back verbatim;
+        pairs with set_raw().
+        """
+        try:
+            if not self._enabled:
+                return None
+
+            value = await self._client.get(self._make_key(key))
+            logger.debug("cache_hit" if value is not None else "cache_miss", key=key)
+            return value
+            
+        except Exception as e:
+            logger.error("cache_get_failed", key=key, error=str(e))
+            return None
+    
+    async def set_raw(
+        self,
+        key: str,
+        payload: Union[str, bytes],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Store an already-serialized JSON document as-is (see get_raw())."""
+        try:
+            if not self._enabled:
+                return False
+
+            expiration = ttl if ttl is not None else self.default_ttl
+            namespaced_key = self._make_key(key)
+            _l1_discard(namespaced_key)
+            await self._client.setex(namespaced_key, timedelta(seconds=expiration), payload)
+            _l1_discard(namespaced_key)
+            
+            logger.debug("cache_set", key=key, ttl=expiration)
+            return True
+            
+        except Exception as e:
+            logger.error("cache_set_failed", key=key, error=str(e))
+            return False
+    
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get many values in a single round-trip (MGET).
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Values in the same order as keys; None for misses or
+            undecodable entries
+        """
+        if not keys:
+            return []
+        try:
+            if not self._enabled:
+                return [None] * len(keys)
+
+            raw = await self._client.mget([self._make_key(k) for k in keys])
+            
+            values: List[Optional[Any]] = []
+            for key, value in zip(keys, raw):
+                if value is None:
+                    values.append(None)
+                    continue
+                try:
+                    values.append(self.codec.loads(value))
+                except ValueError as e:
+                    logger.error("cache_deserialize_failed", key=key, error=str(e))
+                    values.append(None)
+            
+            logger.debug("cache_mget", requested=len(keys), hits=sum(v is not None for v in values))
+            return values
+            
+        except Exception as e:
+            logger.error("cache_mget_failed", count=len(keys), error=str(e))
+            return [None] * len(keys)
+    
+    async def mset(self, mapping: dict, ttl: Optional[int] = None) -> bool:
+        """
+        Store many values with the same TTL in a single round-trip.
+        
+        Uses a non-transactional pipeline of SETEX commands (MSET has no TTL).
+        
+        Args:
+            mapping: Cache key -> value (each JSON serialized)
+            ttl: Time to live in seconds (default: self.default_ttl)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not mapping:
+            return True
+        try:
+            if not self._enabled:
+                return False
+
+            expiration = ttl if ttl is not None else self.default_ttl
+            
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    namespaced_key = self._make_key(key)
+                    _l1_discard(namespaced_key)
+                    pipe.setex(namespaced_key, timedelta(seconds=expiration), self.codec.dumps(value))
+                await pipe.execute()
+            _l1_discard(*(self._make_key(k) for k in mapping))
+            
+            logger.debug("cache_mset", count=len(mapping), ttl=expiration)
+            return True
+            
+        except (TypeError, ValueError) as e:
+            logger.error("cache_serialize_failed", count=len(mapping), error=str(e))
+            return False
+        except Exception as e:
+            logger.error("cache_mset_failed", count=len(mapping), error=str(e))
+            return False
+    
     async def delete(self, key: str) -> bool:
         """
         Delete single cache entry.
@@ -182,12 +480,13 @@ class CacheService:
             True if key existed and was deleted
         """
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return False
 
             namespaced_key = self._make_key(key)
+            _l1_discard(namespaced_key)
             result = await self._client.delete(namespaced_key)
+            _l1_discard(namespaced_key)
             
             logger.debug("cache_delete", key=key, existed=bool(result))
             return bool(result)
@@ -196,36 +495,83 @@ class CacheService:
             logger.error("cache_delete_failed", key=key, error=str(e))
             return False
     
-    async def delete_pattern(self, pattern: str) -> int:
+    async def delete_many(self, keys: List[str]) -> int:
         """
-        Delete all keys matching pattern.
+        Delete several cache entries in one DEL round-trip.
         
-        Useful for invalidating related cache entries.
+        Args:
+            keys: Cache keys to delete
+            
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        if not keys:
+            return 0
+        try:
+            if not self._enabled:
+                return 0
+
+            namespaced_keys = [self._make_key(k) for k in keys]
+            _l1_discard(*namespaced_keys)
+            result = await self._client.delete(*namespaced_keys)
+            _l1_discard(*namespaced_keys)
+            
+            logger.debug("cache_delete_many", count=len(keys), deleted=result)
+            return result
+            
+        except Exception as e:
+            logger.error("cache_delete_many_failed", count=len(keys), error=str(e))
+            return 0
+    
+    async def delete_pattern(self, *patterns: str) -> int:
+        """
+        Delete all keys matching any of the patterns.
+        
+        Useful for invalidating related cache entries. Keys are found with
+        SCAN (large COUNT) and removed with UNLINK on a non-transactional
+        pipeline flushed every _UNLINK_BATCH keys, so memory is reclaimed
+        off the Redis main thread and no single call blocks the server.
+        Keys from all patterns share the same pipeline batches.
         
         Args:
-            pattern: Redis pattern (e.g., "project:*" for all projects)
+            patterns: Redis patterns (e.g., "project:*" for all projects)
             
         Returns:
             Number of keys deleted
         """
+        pattern = ",".join(patterns)
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return 0
 
-            namespaced_pattern = self._make_key(pattern)
+            namespaced_patterns = [self._make_key(p) for p in patterns]
+            
+            def discard_matching_l1() -> None:
+                _l1_discard(*(
+                    k for k in list(_l1)
+                    if any(fnmatch.fnmatchcase(k, p) for p in namespaced_patterns)
+                ))
             
-            # Find matching keys
-            keys = []
-            async for key in self._client.scan_iter(match=namespaced_pattern, count=100):
-                keys.append(key)
+            discard_matching_l1()
             
-            if not keys:
+            deleted = 0
+            queued = 0
+            pipe = self._client.pipeline(transaction=False)
+            for p in namespaced_patterns:
+                async for key in self._client.scan_iter(match=p, count=_SCAN_COUNT):
+                    pipe.unlink(key)
+                    queued += 1
+                    if queued == _UNLINK_BATCH:
+                        deleted += sum(await pipe.execute())
+                        queued = 0
+            if queued:
+                deleted += sum(await pipe.execute())
+            discard_matching_l1()
+            
+            if not deleted:
                 logger.debug("cache_pattern_delete_no_match", pattern=pattern)
                 return 0
             
-            # Delete in batch
-            deleted = await self._client.delete(*keys)
             logger.info("cache_pattern_delete", pattern=pattern, count=deleted)
             return deleted
             
@@ -236,8 +582,7 @@ class CacheService:
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return False
 
             namespaced_key = self._make_key(key)
@@ -249,8 +594,7 @@ class CacheService:
     async def get_ttl(self, key: str) -> Optional[int]:
         """Get remaining TTL for key in seconds."""
         try:
-            await self.connect()
-            if self._client is None:
+            if not self._enabled:
                 return None
 
             namespaced_key = self._make_key(key)
@@ -265,6 +609,48 @@ class CacheService:
 # Decorator for Caching Function Results
 # ========================================
 
+def _default_cache_key(name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Build "<name>:<16 hex>" from a BLAKE2b-8 digest of the call arguments.
+    
+    Arguments are pickled (kwargs sorted by name), so equal values give the
+    same key regardless of kwarg order or repr() details. Only arguments
+    that pickle deterministically (scalars, tuples, lists, dicts, dataclasses,
+    Pydantic models) should feed a default key; anything else should go
+    through key_builder. Non-picklable arguments fall back to hashing str().
+    """
+    h = _blake2b(name.encode(), digest_size=8)
+    try:
+        h.update(pickle.dumps((args, sorted(kwargs.items())), protocol=5))
+    except Exception:
+        h.update(f"{args}:{kwargs}".encode("utf-8", "replace"))
+    return f"{name}:{h.hexdigest()}"
+
+
+def _schedule_set(cache_service: CacheService, key: str, value: Any, ttl: int) -> None:
+    """
+    Write a decorator result to Redis in a background task.
+    
+    The value is serialized here, before the caller gets the result back,
+    so later mutations by the caller can't leak into the cached copy.
+    """
+    global _skipped_sets
+    if not cache_service._enabled:
+        return
+    if len(_pending_sets) >= _MAX_PENDING_SETS:
+        _skipped_sets += 1
+        logger.warning("cache_async_set_skipped", key=key, skipped=_skipped_sets)
+        return
+    try:
+        payload = cache_service.codec.dumps(value)
+    except (TypeError, ValueError) as e:
+        logger.error("cache_serialize_failed", key=key, error=str(e))
+        return
+    task = asyncio.create_task(cache_service.set_raw(key, payload, ttl=ttl))
+    _pending_sets.add(task)
+    task.add_done_callback(_pending_sets.discard)
+
+
 def cache(
     ttl: int = 60,
     namespace: str = "app",
@@ -295,13 +681,10 @@ def cache(
             if key_builder:
                 cache_key = key_builder(*args, **kwargs)
             else:
-                # Default: function_name:hash(args,kwargs)
-                key_parts = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-                key_hash = hashlib.md5(key_parts.encode()).hexdigest()[:16]
-                cache_key = f"{func.__name__}:{key_hash}"
+                cache_key = _default_cache_key(func.__name__, args, kwargs)
             
             # Try to get from cache
-            cache_service = CacheService(namespace=namespace, default_ttl=ttl)
+            cache_service = get_cache_service(namespace, ttl)
             cached_value = await cache_service.get(cache_key)
             
             if cached_value is not None:
@@ -320,8 +703,8 @@ def cache(
             )
             result = await func(*args, **kwargs)
             
-            # Store in cache
-            await cache_service.set(cache_key, result, ttl=ttl)
+            # Store in cache off the response path
+            _schedule_set(cache_service, cache_key, result, ttl)
             
             return result
         
@@ -333,12 +716,9 @@ def cache(
 # Global Cache Instance (Singleton)
 # ========================================
 
-_global_cache: Optional[CacheService] = None
-
-
-def get_cache_service(namespace: str = "app") -> CacheService:
+def get_cache_service(namespace: str = "app", default_ttl: int = 60) -> CacheService:
     """
-    Get global cache service instance (singleton per namespace).
+    Get global cache service instance (singleton per namespace and TTL).
     
     Usage in FastAPI:
         from fastapi import Depends
@@ -354,7 +734,13 @@ def get_cache_service(namespace: str = "app") -> CacheService:
                 return cached
             # ... fetch from DB and cache
     """
-    return CacheService(namespace=namespace)
+    service = _svc_cache.get((namespace, default_ttl))
+    if service is None:
+        service = _svc_cache.setdefault(
+            (namespace, default_ttl),
+            CacheService(namespace=namespace, default_ttl=default_ttl)
+        )
+    return service
 
 
 # ========================================
@@ -363,23 +749,50 @@ def get_cache_service(namespace: str = "app") -> CacheService:
 
 async def invalidate_project_cache(project_id: int):
     """Invalidate all cache entries related to a project."""
-    cache = CacheService(namespace="projects")
-    await cache.delete(f"project:{project_id}")
-    await cache.delete(f"project:detail:{project_id}")
+    cache = get_cache_service("projects")
+    await cache.delete_many([f"project:{project_id}", f"project:detail:{project_id}"])
     logger.info("project_cache_invalidated", project_id=project_id)
 
 
+async def warm_project_cache(project_id: int, payload: Union[str, bytes], ttl: int):
+    """
+    Store a freshly written project's rendered detail response.
+    
+    Called right after create/update/status changes so the next GET is a
+    hit instead of a recompute; invalidate_project_cache() still clears it.
+    """
+    cache = get_cache_service("projects")
+    await cache.set_raw(f"project:detail:{project_id}", payload, ttl=ttl)
+
+
+async def invalidate_projects_cache(project_ids: List[int]):
+    """Invalidate the entries of many projects at once (bulk operations)."""
+    cache = get_cache_service("projects")
+    await cache.delete_many([
+        key
+        for project_id in project_ids
+        for key in (f"project:{project_id}", f"project:detail:{project_id}")
+    ])
+    logger.info("projects_cache_invalidated", count=len(project_ids))
+
+
 async def invalidate_projects_list_cache():
     """Invalidate project list caches (when new project created)."""
-    cache = CacheService(namespace="projects")
-    await cache.delete_pattern("list:*")
-    await cache.delete_pattern("statistics:*")
+    cache = get_cache_service("projects")
+    # Independent SCAN streams: run them side by side on separate connections
+    await asyncio.gather(cache.delete_pattern("list:*"), cache.delete_pattern("statistics:*"))
     logger.info("projects_list_cache_invalidated")
 
 
+async def invalidate_user_search_cache():
+    """Invalidate cached user autocomplete results (user added/changed)."""
+    cache = get_cache_service("users")
+    await cache.delete_pattern("search:*")
+    logger.info("user_search_cache_invalidated")
+
+
 async def invalidate_user_cache(user_id: int):
     """Invalidate all cache entries related to a user."""
-    cache = CacheService(namespace="users")
-    await cache.delete(f"user:{user_id}")
-    await cache.delete(f"user:projects:{user_id}")
+    cache = get_cache_service("users")
+    await cache.delete_many([f"user:{user_id}", f"user:projects:{user_id}"])
     logger.info("user_cache_invalidated", user_id=user_id)
@@ -1,10 +1,10 @@
 """
 Application Configuration Settings
 """
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import AliasChoices, Field
 from typing import List, Optional
-import secrets
 
 
 class Settings(BaseSettings):
@@ -17,11 +17,25 @@ class Settings(BaseSettings):
     db_name: str
     db_port: int = 3306
     
-    @property
+    @cached_property
     def database_url(self) -> str:
         return f"mysql+pymysql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
     test_database_url: str = "sqlite:///./test_checklist.db"
+
+    # Connection pool (per worker process)
+    # Set db_null_pool=True when an external pooler (e.g. PgBouncer in
+    # transaction mode) or a serverless runtime owns connection reuse.
+    # MySQL skips pre-ping by default (one SELECT 1 per checkout); recycling
+    # well under the server's wait_timeout keeps connections fresh instead.
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    db_null_pool: bool = False
+    # Compiled-statement cache entries per engine (SQLAlchemy default: 500)
+    db_query_cache_size: int = 1200
     
     # Redis Cache Configuration
     # Format: redis://[user:password@]host:port/database
@@ -42,12 +56,24 @@ class Settings(BaseSettings):
         env="REDIS_DEFAULT_TTL",
         description="Default cache TTL in seconds"
     )
+    REDIS_MAX_CONNECTIONS: int = Field(
+        default=50,
+        env="REDIS_MAX_CONNECTIONS",
+        description="Size cap of the per-process Redis connection pool"
+    )
     
     # Security
-    # CRITICAL: Secret key MUST be set via environment variable
+    # CRITICAL: Secret key MUST be set via environment variable (SECRET_KEY or
+    # JWT_SECRET_KEY); there is no generated fallback, so a missing key stops
+    # startup instead of silently signing with a per-process random key.
     # Generate with: openssl rand -base64 32
-    # Never use default value in production - tokens will be invalidated on restart
-    secret_key: str = Field(..., description="JWT signing key - REQUIRED")
+    # Rotation: deploy the new value to every worker at once; tokens signed
+    # with the old key are rejected and clients must log in again.
+    secret_key: str = Field(
+        ...,
+        validation_alias=AliasChoices("secret_key", "jwt_secret_key"),
+        description="JWT signing key - REQUIRED"
+    )
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 7
     algorithm: str = "HS256"
@@ -89,5 +115,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build (and validate) the settings once per process."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -4,26 +4,39 @@ Database configuration and setup
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 # Create database engine
-engine_kwargs = {"echo": False}  # Default echo to False
+db_url = settings.database_url
+engine_kwargs = {
+    "echo": False,  # Default echo to False
+    "query_cache_size": settings.db_query_cache_size,
+}
 
 # Add SQLite-specific configuration
-if settings.database_url.startswith("sqlite"):
+if db_url.startswith("sqlite"):
     engine_kwargs.update({
         "connect_args": {"check_same_thread": False}  # Needed for SQLite
     })
-elif settings.database_url.startswith("mysql"):
+elif db_url.startswith("mysql"):
     # MySQL configuration
     engine_kwargs.update({
-        "pool_pre_ping": True,        # Verifica conexão antes de usar
-        "pool_recycle": 3600,          # Recicla conexões a cada 1h
-        "pool_size": 5,                # Máximo de 5 conexões simultâneas
-        "max_overflow": 10,            # Permite até 10 conexões extras
+        "pool_pre_ping": settings.db_pool_pre_ping,   # Sem SELECT 1 por checkout (padrão)
+        "pool_recycle": settings.db_pool_recycle,     # Recicla conexões (padrão 30min)
+        "pool_size": settings.db_pool_size,           # Conexões mantidas abertas
+        "max_overflow": settings.db_max_overflow,     # Conexões extras sob pico
+        "pool_timeout": settings.db_pool_timeout,     # Espera máxima por conexão livre
+        "pool_reset_on_return": "rollback",           # ROLLBACK simples ao devolver
+        "isolation_level": "READ COMMITTED",          # Sem gap locks em leituras
         "connect_args": {
             "connect_timeout": 10,     # Timeout de 10 segundos
-            "charset": "utf8mb4"       # Suporte a emojis e caracteres especiais
+            "charset": "utf8mb4",      # Suporte a emojis e caracteres especiais
+            "use_unicode": True,
+            "autocommit": False
         }
     })
 else:
@@ -31,21 +44,22 @@ else:
     engine_kwargs.update({
         "pool_pre_ping": True,
         "pool_recycle": 300,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
     })
 
-engine = create_engine(settings.database_url, **engine_kwargs)
+if settings.db_null_pool and not db_url.startswith("sqlite"):
+    # Pooling delegated to an external pooler: open/close per checkout
+    for key in ("pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+        engine_kwargs.pop(key, None)
+    engine_kwargs["poolclass"] = NullPool
+
+engine = create_engine(db_url, **engine_kwargs)
+logger.info("database_engine_created", pool=engine.pool.status())
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create base class for models
 Base = declarative_base()
-
-
-def get_db():
-    """Database session dependency for FastAPI."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
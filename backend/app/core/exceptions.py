@@ -1,7 +1,18 @@
 """
 Custom exceptions for the application
 """
-from fastapi import HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.core.logging import get_logger
+from app.domain.entities.project import BusinessRuleViolationError, InvalidStateTransitionError
+from app.domain.repositories.project_repository import (
+    ConcurrentModificationError,
+    ProjectAccessDeniedError,
+    ProjectNotFoundError
+)
+
+logger = get_logger(__name__)
 
 
 class CheckinSystemException(Exception):
@@ -55,65 +66,112 @@ class ValidationException(CheckinSystemException):
 
 
 # HTTP Exception helpers
-def user_not_found():
+# A fresh HTTPException per call: a shared instance raised from concurrent
+# requests would have its __traceback__/__context__ overwritten across them.
+USER_NOT_FOUND_DETAIL = "Usuário não encontrado"
+PROJECT_NOT_FOUND_DETAIL = "Projeto não encontrado"
+CLIENT_NOT_FOUND_DETAIL = "Cliente não encontrado"
+ACTIVE_CHECKIN_EXISTS_DETAIL = "Você já possui um check-in ativo. Finalize-o antes de iniciar um novo."
+NO_ACTIVE_CHECKIN_DETAIL = "Nenhum check-in ativo encontrado"
+UNAUTHORIZED_DETAIL = "Não autorizado para esta operação"
+INVALID_CREDENTIALS_DETAIL = "Email ou senha inválidos"
+FILE_TOO_LARGE_DETAIL = "Arquivo muito grande. Tamanho máximo: 10MB"
+INVALID_FILE_TYPE_DETAIL = "Tipo de arquivo não permitido"
+
+
+def user_not_found() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
-        detail="Usuário não encontrado"
+        detail=USER_NOT_FOUND_DETAIL
     )
 
 
-def project_not_found():
+def project_not_found() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
-        detail="Projeto não encontrado"
+        detail=PROJECT_NOT_FOUND_DETAIL
     )
 
 
-def client_not_found():
+def client_not_found() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
-        detail="Cliente não encontrado"
+        detail=CLIENT_NOT_FOUND_DETAIL
     )
 
 
-def active_checkin_exists():
+def active_checkin_exists() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_409_CONFLICT,
-        detail="Você já possui um check-in ativo. Finalize-o antes de iniciar um novo."
+        detail=ACTIVE_CHECKIN_EXISTS_DETAIL
     )
 
 
-def no_active_checkin():
+def no_active_checkin() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_404_NOT_FOUND,
-        detail="Nenhum check-in ativo encontrado"
+        detail=NO_ACTIVE_CHECKIN_DETAIL
     )
 
 
-def unauthorized():
+def unauthorized() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
-        detail="Não autorizado para esta operação"
+        detail=UNAUTHORIZED_DETAIL
     )
 
 
-def invalid_credentials():
+def invalid_credentials() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Email ou senha inválidos",
+        detail=INVALID_CREDENTIALS_DETAIL,
         headers={"WWW-Authenticate": "Bearer"}
     )
 
 
-def file_too_large():
+def file_too_large() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-        detail="Arquivo muito grande. Tamanho máximo: 10MB"
+        detail=FILE_TOO_LARGE_DETAIL
     )
 
 
-def invalid_file_type():
+def invalid_file_type() -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
-        detail="Tipo de arquivo não permitido"
-    )
\ No newline at end of file
+        detail=INVALID_FILE_TYPE_DETAIL
+    )
+
+
+# Domain exception -> HTTP status. Routes let these propagate instead of
+# wrapping every service call in try/except.
+DOMAIN_ERROR_STATUS = {
+    ProjectNotFoundError: status.HTTP_404_NOT_FOUND,
+    ProjectAccessDeniedError: status.HTTP_403_FORBIDDEN,
+    ConcurrentModificationError: status.HTTP_409_CONFLICT,
+    InvalidStateTransitionError: status.HTTP_400_BAD_REQUEST,
+    BusinessRuleViolationError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+async def domain_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Render a domain exception as {"detail": message} with its mapped status."""
+    # Handlers are matched along the MRO, so subclasses land here too
+    status_code = next(
+        DOMAIN_ERROR_STATUS[cls] for cls in type(exc).__mro__ if cls in DOMAIN_ERROR_STATUS
+    )
+    logger.warning(
+        "domain_error",
+        error_type=type(exc).__name__,
+        reason=str(exc),
+        method=request.method,
+        path=request.url.path,
+        status_code=status_code
+    )
+    return ORJSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Install the domain exception handlers on the application."""
+    for exc_class in DOMAIN_ERROR_STATUS:
+        app.add_exception_handler(exc_class, domain_error_handler)
@@ -15,6 +15,7 @@ import sys
 from typing import Any, Dict
 from contextvars import ContextVar
 
+import orjson
 import structlog
 from pythonjsonlogger import jsonlogger
 
@@ -41,13 +42,35 @@ def add_correlation_ids(logger: Any, method_name: str, event_dict: Dict) -> Dict
     return event_dict
 
 
+_configured = False
+
+
+def _orjson_dumps(event_dict: Dict, **kwargs: Any) -> str:
+    """
+    JSONRenderer serializer backed by orjson.
+    
+    Returns str (the stdlib logger factory writes text); values orjson can't
+    encode natively fall back to str(), like structlog's default handler.
+    """
+    return orjson.dumps(
+        event_dict, default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode("utf-8")
+
+
 def configure_logging() -> None:
     """
     Configure structured logging for the application.
     
     Production: JSON logs to stdout (cloud-native, works with log aggregators)
     Development: Pretty console output for easier debugging
+    
+    Idempotent: the processor chain is built once per process.
     """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    
     # Determine log level from environment
     log_level = logging.DEBUG if settings.debug else logging.INFO
     
@@ -65,25 +88,28 @@ def configure_logging() -> None:
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
         add_correlation_ids,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
     ]
     
     if settings.environment == "development":
         # Development: Pretty console output
+        # ConsoleRenderer formats exc_info itself
         processors = shared_processors + [
             structlog.dev.ConsoleRenderer()
         ]
     else:
         # Production: JSON output for log aggregators (ELK, Datadog, etc)
         processors = shared_processors + [
-            structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer()
+            # Only does work for events logged with exc_info
+            structlog.processors.ExceptionRenderer(
+                structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+            ),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ]
     
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        processors=tuple(processors),
+        # Calls below log_level return immediately, before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -111,7 +137,8 @@ def get_logger(name: str = __name__) -> structlog.BoundLogger:
 def set_request_context(request_id: str, user_id: str = "") -> None:
     """
     Set correlation IDs for the current request context.
-    Should be called by middleware at the start of each request.
+    Should be called by middleware at the start of each request, inside
+    a copied context (contextvars.copy_context) owned by that request.
     
     Args:
         request_id: Unique identifier for this request (UUID)
@@ -122,12 +149,6 @@ def set_request_context(request_id: str, user_id: str = "") -> None:
         user_id_ctx_var.set(user_id)
 
 
-def clear_request_context() -> None:
-    """Clear correlation IDs after request processing."""
-    request_id_ctx_var.set("")
-    user_id_ctx_var.set("")
-
-
 # Initialize logging on module import
 configure_logging()
 
@@ -1,10 +1,15 @@
 """
 Security utilities for authentication and password handling
 """
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from time import monotonic, time
+from typing import Optional, Dict, Any, Tuple
+import jwt
 from passlib.context import CryptContext
-from jose import JWTError, jwt
 from fastapi import HTTPException, status
 from app.core.config import settings
 
@@ -34,6 +39,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+# Successful verifications, remembered briefly so repeated logins with the
+# same credential skip bcrypt. Keys are keyed BLAKE2b digests of password +
+# stored hash (a per-process random key, so the table is useless offline;
+# a password change yields a new hash and thus a new key). Failures are
+# never cached: wrong guesses always pay the full bcrypt cost.
+_VERIFIED_MAXSIZE = 10_000
+_VERIFIED_TTL = 300.0
+_VERIFIED_KEY = os.urandom(32)
+_verified: "OrderedDict[bytes, float]" = OrderedDict()
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password() for async code: bcrypt runs in a worker thread."""
+    digest = hashlib.blake2b(
+        plain_password.encode("utf-8") + b"\0" + hashed_password.encode("utf-8"),
+        key=_VERIFIED_KEY,
+        digest_size=16
+    ).digest()
+    expires_at = _verified.get(digest)
+    if expires_at is not None:
+        if expires_at > monotonic():
+            return True
+        del _verified[digest]
+    
+    ok = await asyncio.to_thread(verify_password, plain_password, hashed_password)
+    if ok:
+        _verified[digest] = monotonic() + _VERIFIED_TTL
+        if len(_verified) > _VERIFIED_MAXSIZE:
+            _verified.popitem(last=False)
+    return ok
+
+
+async def ahash_password(password: str) -> str:
+    """hash_password() for async code: bcrypt runs in a worker thread."""
+    return await asyncio.to_thread(hash_password, password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -60,22 +102,59 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+# Verified token payloads: BLAKE2b-16 of the token -> (expires_at, claims).
+# Entries live at most _TOKEN_CACHE_TTL seconds and never past the token's
+# own exp, so an expired token is always re-checked (and rejected).
+_TOKEN_CACHE_MAXSIZE = 50_000
+_TOKEN_CACHE_TTL = 60.0
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
 def verify_token(token: str) -> Dict[str, Any]:
-    """Verify and decode a JWT token."""
+    """
+    Verify and decode a JWT token.
+    
+    Successful decodes are memoized in-process, so a client reusing its
+    token skips the signature check; treat the returned claims as read-only.
+    """
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    entry = _token_cache.get(digest)
+    if entry is not None:
+        if entry[0] > monotonic():
+            return entry[1]
+        # pop(): a parallel request may already have evicted it
+        _token_cache.pop(digest, None)
+    
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    ttl = _TOKEN_CACHE_TTL
+    if "exp" in payload:
+        ttl = min(ttl, payload["exp"] - time())
+    if ttl > 0:
+        _token_cache[digest] = (monotonic() + ttl, payload)
+        if len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            try:
+                _token_cache.popitem(last=False)
+            except KeyError:
+                # Emptied by another thread between the len() and the pop
+                pass
+    return payload
 
 
 def get_user_id_from_token(token: str) -> int:
     """Extract user ID from JWT token."""
-    payload = verify_token(token)
+    return get_user_id_from_payload(verify_token(token))
+
+
+def get_user_id_from_payload(payload: Dict[str, Any]) -> int:
+    """Extract user ID from an already verified JWT payload."""
     user_id: Optional[str] = payload.get("sub")
     
     if user_id is None:
@@ -90,7 +169,10 @@ def get_user_id_from_token(token: str) -> int:
 
 def get_user_role_from_token(token: str) -> str:
     """Extract user role from JWT token."""
-    payload = verify_token(token)
+    return _role_from_payload(verify_token(token))
+
+
+def _role_from_payload(payload: Dict[str, Any]) -> str:
     role: Optional[str] = payload.get("role")
     
     if role is None:
@@ -17,9 +17,14 @@ Architecture Pattern: Unit of Work (Martin Fowler)
 - Handles rollback on errors
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Any
-from sqlalchemy.orm import Session
+import itertools
+from contextlib import contextmanager
+from typing import Iterator, Optional, Any
+from fastapi import Depends
+from sqlalchemy.orm import Session, SessionTransaction
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.db.session import get_db
 from app.core.logging import get_logger
 from app.infrastructure.repositories.sqlalchemy_project_repository import (
     SQLAlchemyProjectRepository
@@ -27,6 +32,10 @@ from app.infrastructure.repositories.sqlalchemy_project_repository import (
 
 logger = get_logger(__name__)
 
+# configure_logging() filters debug out unless settings.debug; checking the
+# same flag up front also skips building the event kwargs (id(), dict)
+_DEBUG_LOGS = settings.debug
+
 
 class IUnitOfWork(ABC):
     """
@@ -62,6 +71,35 @@ class IUnitOfWork(ABC):
         pass
 
 
+class _LazyRepo:
+    """
+    Repository attribute bound to the UoW's session on first access.
+    
+    Non-data descriptor: the instance is stored in the UoW's __dict__ under
+    the same name, so later accesses are a plain attribute lookup (the
+    cached_property trick). __exit__ drops it with the session.
+    """
+    
+    def __init__(self, repo_cls):
+        self.repo_cls = repo_cls
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+        owner._repo_names = (*getattr(owner, "_repo_names", ()), name)
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if instance._session is None:
+            raise RuntimeError(
+                "Cannot access repository outside UnitOfWork context. "
+                "Use 'with SqlAlchemyUnitOfWork() as uow:' block."
+            )
+        repo = self.repo_cls(instance._session)
+        instance.__dict__[self.name] = repo
+        return repo
+
+
 class SqlAlchemyUnitOfWork(IUnitOfWork):
     """
     SQLAlchemy implementation of Unit of Work.
@@ -77,37 +115,45 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
             project = uow.projects.get_by_id(1)
             project.start()
             uow.projects.save(project)
-            uow.commit()  # ← Atomic commit
-        # If exception occurs, automatic rollback
+        # Clean exit commits; if exception occurs, automatic rollback
+    
+    uow.commit() may still be called to end the transaction early; the
+    block then commits whatever ran after it. uow.nested() wraps a sub-step
+    in a SAVEPOINT so it can fail without aborting the whole unit.
     """
     
-    def __init__(self, session_factory=SessionLocal):
+    def __init__(self, session_factory=SessionLocal, session: Optional[Session] = None):
         """
         Initialize Unit of Work.
         
         Args:
             session_factory: Factory function to create SQLAlchemy session
                             (default: SessionLocal from database.py)
+            session: Existing session to run on instead (e.g. the request's
+                     get_db session); it is borrowed, so __exit__ leaves it open
         """
         self.session_factory = session_factory
+        self._borrowed = session
         self._session: Optional[Session] = None
-        
-        # Repository instances (lazy loaded)
-        self._projects: Optional[SQLAlchemyProjectRepository] = None
     
     def __enter__(self):
         """
         Enter context manager - begin transaction.
         
-        Creates new SQLAlchemy session and initializes repositories.
+        Creates new SQLAlchemy session (or takes the borrowed one) and
+        opens an explicit transaction on it. A borrowed session that is
+        already inside a transaction keeps it.
         """
-        self._session = self.session_factory()
-        logger.debug("uow_transaction_started", session_id=id(self._session))
+        self._session = self._borrowed if self._borrowed is not None else self.session_factory()
+        if not self._session.in_transaction():
+            self._session.begin()
+        if _DEBUG_LOGS:
+            logger.debug("uow_transaction_started", session_id=id(self._session))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
-        Exit context manager - commit or rollback.
+        Exit context manager - commit on clean exit, rollback on exception.
         
         Args:
             exc_type: Exception type (None if no exception)
@@ -117,58 +163,50 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         Returns:
             False to propagate exception (after rollback)
         """
-        if exc_type is not None:
-            # Exception occurred - rollback transaction
-            logger.warning(
-                "uow_transaction_rollback",
-                exception_type=exc_type.__name__,
-                exception_message=str(exc_val),
-                session_id=id(self._session)
-            )
-            self.rollback()
-        else:
-            # No exception - commit not called explicitly is OK
-            # (some flows may call commit() manually)
-            pass
-        
-        # Always close session
-        if self._session:
-            self._session.close()
-            logger.debug("uow_session_closed", session_id=id(self._session))
-            self._session = None
+        try:
+            if exc_type is not None:
+                # Exception occurred - rollback transaction
+                logger.warning(
+                    "uow_transaction_rollback",
+                    exception_type=exc_type.__name__,
+                    exception_message=str(exc_val),
+                    session_id=id(self._session)
+                )
+                self.rollback()
+            else:
+                # No exception - commit, so a forgotten commit() no longer
+                # drops writes (no-op if the flow already committed)
+                self.commit()
+        finally:
+            self._release()
         
         # Return False to propagate exception
         return False
     
-    @property
-    def projects(self) -> SQLAlchemyProjectRepository:
-        """
-        Get project repository (lazy loaded).
+    def _release(self) -> None:
+        """Close an owned session and unbind the repositories."""
+        # Always close session (a borrowed one belongs to its owner)
+        if self._session:
+            if self._session is not self._borrowed:
+                self._session.close()
+                if _DEBUG_LOGS:
+                    logger.debug("uow_session_closed", session_id=id(self._session))
+            self._session = None
         
-        Returns:
-            Project repository instance sharing this UoW's session
-        """
-        if self._projects is None:
-            if self._session is None:
-                raise RuntimeError(
-                    "Cannot access repository outside UnitOfWork context. "
-                    "Use 'with SqlAlchemyUnitOfWork() as uow:' block."
-                )
-            self._projects = SQLAlchemyProjectRepository(self._session)
-        return self._projects
+        # Repositories were bound to that session
+        for name in self._repo_names:
+            self.__dict__.pop(name, None)
+    
+    # Successful commits are logged at info once per _log_sample_rate
+    # (process-wide count; next() on itertools.count is atomic)
+    _log_sample_rate: int = 1000
+    _commit_counter = itertools.count(1)
     
+    # Repositories (lazy loaded, sharing this UoW's session)
+    projects = _LazyRepo(SQLAlchemyProjectRepository)
     # Future repositories (uncomment when implemented):
-    # @property
-    # def users(self) -> SQLAlchemyUserRepository:
-    #     if self._users is None:
-    #         self._users = SQLAlchemyUserRepository(self._session)
-    #     return self._users
-    #
-    # @property
-    # def checkins(self) -> SQLAlchemyCheckinRepository:
-    #     if self._checkins is None:
-    #         self._checkins = SQLAlchemyCheckinRepository(self._session)
-    #     return self._checkins
+    # users = _LazyRepo(SQLAlchemyUserRepository)
+    # checkins = _LazyRepo(SQLAlchemyCheckinRepository)
     
     def commit(self):
         """
@@ -185,9 +223,18 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         if self._session is None:
             raise RuntimeError("Cannot commit outside UnitOfWork context")
         
+        if not self._session.in_transaction():
+            # Already committed (explicit commit() or a repository commit)
+            return
+        
         try:
             self._session.commit()
-            logger.info("uow_transaction_committed", session_id=id(self._session))
+            if _DEBUG_LOGS:
+                logger.debug("uow_transaction_committed", session_id=id(self._session))
+            else:
+                count = next(self._commit_counter)
+                if count % self._log_sample_rate == 0:
+                    logger.info("uow_transactions_committed", count=count)
         except Exception as e:
             logger.error(
                 "uow_commit_failed",
@@ -210,7 +257,8 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
         
         try:
             self._session.rollback()
-            logger.info("uow_transaction_rolledback", session_id=id(self._session))
+            if _DEBUG_LOGS:
+                logger.debug("uow_transaction_rolledback", session_id=id(self._session))
         except Exception as e:
             logger.error(
                 "uow_rollback_failed",
@@ -220,6 +268,25 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
             )
             raise
     
+    @contextmanager
+    def nested(self) -> Iterator[SessionTransaction]:
+        """
+        Run a sub-step inside a SAVEPOINT.
+        
+        On exception only the sub-step is rolled back (ROLLBACK TO SAVEPOINT)
+        and the exception propagates; the outer transaction stays usable, so
+        the caller may catch it and retry or carry on.
+        
+        Usage:
+            with uow.nested():
+                uow.projects.save(project)
+        """
+        if self._session is None:
+            raise RuntimeError("Cannot open a savepoint outside UnitOfWork context")
+        
+        with self._session.begin_nested() as savepoint:
+            yield savepoint
+    
     def flush(self):
         """
         Flush changes to database without committing.
@@ -231,33 +298,40 @@ class SqlAlchemyUnitOfWork(IUnitOfWork):
             raise RuntimeError("Cannot flush outside UnitOfWork context")
         
         self._session.flush()
-        logger.debug("uow_session_flushed", session_id=id(self._session))
+        if _DEBUG_LOGS:
+            logger.debug("uow_session_flushed", session_id=id(self._session))
 
 
 # ========================================
 # Dependency Injection for FastAPI
 # ========================================
 
-def get_unit_of_work() -> SqlAlchemyUnitOfWork:
+def get_unit_of_work(db: Session = Depends(get_db)) -> Iterator[SqlAlchemyUnitOfWork]:
     """
     Dependency injection function for FastAPI.
     
+    Yields an already-entered UoW: FastAPI enters it before the handler
+    runs and exits it afterwards, committing on success and rolling back
+    if the handler raised, so controllers need no `with` block.
+    
+    Runs on the request's get_db session (FastAPI resolves get_db once per
+    request), so the UoW and any other get_db consumer in the same request
+    share one pooled connection instead of checking out a second one.
+    
     Usage in controllers:
         @router.post("/projects")
-        async def create_project(
+        def create_project(
             request: ProjectCreateRequest,
             uow: SqlAlchemyUnitOfWork = Depends(get_unit_of_work)
         ):
-            with uow:
-                project = Project(name=request.name, ...)
-                uow.projects.save(project)
-                uow.commit()
-            return project
+            project = Project(name=request.name, ...)
+            return uow.projects.save(project)
     
-    Note: UoW is NOT used as context manager here because FastAPI
-    handles it. Service layer should use context manager.
+    Service layer code outside a request should still use the context
+    manager directly.
     """
-    return SqlAlchemyUnitOfWork()
+    with SqlAlchemyUnitOfWork(session=db) as uow:
+        yield uow
 
 
 # ========================================
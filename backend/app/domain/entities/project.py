@@ -23,6 +23,22 @@ class ProjectStatus(str, Enum):
     PAUSADO = "pausado"
     CONCLUIDO = "concluido"
     CANCELADO = "cancelado"
+    
+    @classmethod
+    def parse(cls, value: str) -> "ProjectStatus":
+        """ProjectStatus(value) as a plain dict lookup (KeyError if unknown)."""
+        return STATUS_BY_VALUE[value]
+
+
+STATUS_BY_VALUE: dict[str, ProjectStatus] = {s.value: s for s in ProjectStatus}
+
+
+# Status groups used by the transition/query methods below, built once
+# instead of per call. Compared with == (not `is`) so a status that arrives
+# as its plain str value still matches.
+_STARTABLE = frozenset({ProjectStatus.PLANEJAMENTO, ProjectStatus.PAUSADO})
+_TERMINAL = frozenset({ProjectStatus.CONCLUIDO, ProjectStatus.CANCELADO})
+_ACTIVE = ProjectStatus.EM_ANDAMENTO
 
 
 class InvalidStateTransitionError(Exception):
@@ -35,7 +51,7 @@ class BusinessRuleViolationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Project:
     """
     Project domain entity - Rich domain model with business behavior.
@@ -49,6 +65,9 @@ class Project:
     Architecture Note:
     This class knows NOTHING about databases, HTTP, or frameworks.
     It only knows business rules. Persistence is handled by repositories.
+    
+    Slotted (no per-instance __dict__): one is built per row on list reads.
+    Equality/hash are identity-by-id, defined by hand below.
     """
     
     # Identity
@@ -84,10 +103,30 @@ class Project:
     updated_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
     
+    # Concurrency - row version this entity was read at (optimistic locking)
+    version: int = 0
+    
     def __post_init__(self):
         """Validate business invariants after initialization."""
         self._validate_dates()
     
+    @classmethod
+    def from_persistence(cls, **fields: Any) -> "Project":
+        """
+        Rebuild an already-persisted project without re-running validation.
+        
+        For repositories only: stored rows were validated when they were
+        written, so hydrating them skips __init__/__post_init__. Transient
+        relationship fields default to empty unless passed in.
+        """
+        obj = object.__new__(cls)
+        obj.client = None
+        obj.responsible_user = None
+        obj.contributors = []
+        for name, value in fields.items():
+            setattr(obj, name, value)
+        return obj
+    
     def _validate_dates(self) -> None:
         """
         Business Rule: End date must be after start date.
@@ -113,15 +152,13 @@ class Project:
         
         Raises: InvalidStateTransitionError
         """
-        allowed_states = {ProjectStatus.PLANEJAMENTO, ProjectStatus.PAUSADO}
-        
-        if self.status not in allowed_states:
+        if self.status not in _STARTABLE:
             raise InvalidStateTransitionError(
                 f"Cannot start project from status {self.status}. "
-                f"Allowed: {', '.join(s.value for s in allowed_states)}"
+                f"Allowed: {', '.join(s.value for s in _STARTABLE)}"
             )
         
-        self.status = ProjectStatus.EM_ANDAMENTO
+        self.status = _ACTIVE
     
     def pause(self) -> None:
         """
@@ -129,7 +166,7 @@ class Project:
         
         Business Rule: Only running projects can be paused.
         """
-        if self.status != ProjectStatus.EM_ANDAMENTO:
+        if self.status != _ACTIVE:
             raise InvalidStateTransitionError(
                 f"Can only pause projects that are EM_ANDAMENTO, not {self.status}"
             )
@@ -148,7 +185,7 @@ class Project:
         Args:
             completion_date: Actual completion date (defaults to today)
         """
-        if self.status != ProjectStatus.EM_ANDAMENTO:
+        if self.status != _ACTIVE:
             raise InvalidStateTransitionError(
                 "Can only complete projects that are EM_ANDAMENTO"
             )
@@ -182,7 +219,7 @@ class Project:
     @property
     def is_active(self) -> bool:
         """Check if project is currently active."""
-        return self.status == ProjectStatus.EM_ANDAMENTO and self.deleted_at is None
+        return self.status == _ACTIVE and self.deleted_at is None
     
     @property
     def is_completed(self) -> bool:
@@ -197,7 +234,7 @@ class Project:
     @property
     def is_modifiable(self) -> bool:
         """Check if project can be modified (not completed or cancelled)."""
-        return self.status not in {ProjectStatus.CONCLUIDO, ProjectStatus.CANCELADO}
+        return self.status not in _TERMINAL
     
     @property
     def duration_days(self) -> Optional[int]:
@@ -271,3 +308,26 @@ class Project:
     def __hash__(self) -> int:
         """Hash based on identity for use in sets/dicts."""
         return hash(self.id) if self.id else hash(id(self))
+
+
+# Set-based form of the transition methods above, used by bulk updates:
+# action -> (target status, statuses the transition is allowed from).
+# Keep in sync with start()/pause()/complete()/cancel().
+STATUS_TRANSITIONS: dict[str, tuple[ProjectStatus, frozenset[ProjectStatus]]] = {
+    "start": (
+        _ACTIVE,
+        _STARTABLE,
+    ),
+    "pause": (
+        ProjectStatus.PAUSADO,
+        frozenset({_ACTIVE}),
+    ),
+    "complete": (
+        ProjectStatus.CONCLUIDO,
+        frozenset({_ACTIVE}),
+    ),
+    "cancel": (
+        ProjectStatus.CANCELADO,
+        _STARTABLE | {_ACTIVE},
+    ),
+}
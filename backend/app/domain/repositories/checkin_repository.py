@@ -1,44 +1,130 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy import desc, lambda_stmt, select
 from app.models.checkin import Checkin, CheckinStatus
+from app.models.project import Project
+
+
+# Statement builders shared by every CheckinRepository instance. lambda_stmt
+# caches the constructed statement and its compiled SQL process-wide, keyed on
+# the lambda's code; closure values become bound parameters.
+def _by_id_stmt(checkin_id: int):
+    return lambda_stmt(lambda: select(Checkin).where(Checkin.id == checkin_id))
+
+
+def _active_by_user_stmt(user_id: int, with_project: bool = False):
+    stmt = lambda_stmt(
+        lambda: select(Checkin).where(
+            Checkin.usuario_id == user_id,
+            Checkin.status == CheckinStatus.EM_ANDAMENTO,
+            Checkin.deleted_at.is_(None)
+        )
+    )
+    if with_project:
+        stmt += lambda s: s.options(joinedload(Checkin.projeto))
+    return stmt
+
+
+def _history_stmt(cursor: Optional[int], limit: int):
+    # The list only shows the project name: fetch it with one IN query per
+    # page, and make any other relationship access raise instead of lazily
+    # issuing one SELECT per row.
+    stmt = lambda_stmt(
+        lambda: select(Checkin)
+        .options(
+            selectinload(Checkin.projeto).load_only(Project.nome),
+            raiseload("*")
+        )
+        .where(Checkin.deleted_at.is_(None))
+    )
+    if cursor is not None:
+        stmt += lambda s: s.where(Checkin.id < cursor)
+    # Computed outside the lambda: inside it, limit + 1 would become the SQL
+    # expression LIMIT :p + :p, which MySQL rejects
+    fetch = limit + 1
+    stmt += lambda s: s.order_by(desc(Checkin.id)).limit(fetch)
+    return stmt
+
 
 class CheckinRepository:
+    """
+    Thin per-request binder: holds the session, statements are module-level.
+    
+    Writes only flush (INSERT/UPDATE, generated IDs available); the caller
+    decides when the transaction ends via commit().
+    """
+    
     def __init__(self, session: Session):
         self.session = session
+        # user_id -> active check-in (or None) for this repository's lifetime;
+        # a user has at most one, and every write below drops the entry
+        self._active_checkin_cache: Dict[int, Optional[Checkin]] = {}
 
     def create(self, checkin: Checkin) -> Checkin:
         self.session.add(checkin)
-        self.session.commit()
-        self.session.refresh(checkin)
+        self.session.flush()
+        self._active_checkin_cache.pop(checkin.usuario_id, None)
         return checkin
     
+    def bulk_create(self, checkins: List[Checkin]) -> List[Checkin]:
+        """Insert many check-ins in one flush (batched INSERT)."""
+        self.session.add_all(checkins)
+        self.session.flush()
+        for checkin in checkins:
+            self._active_checkin_cache.pop(checkin.usuario_id, None)
+        return checkins
+    
     def update(self, checkin: Checkin) -> Checkin:
         self.session.add(checkin)
-        self.session.commit()
-        self.session.refresh(checkin)
+        self.session.flush()
+        self._active_checkin_cache.pop(checkin.usuario_id, None)
         return checkin
 
+    def commit(self, *checkins: Checkin) -> None:
+        """Commit the transaction and reload the given rows (server defaults)."""
+        self.session.commit()
+        for checkin in checkins:
+            self.session.refresh(checkin)
+
     def get_by_id(self, checkin_id: int) -> Optional[Checkin]:
-        return self.session.query(Checkin).filter(Checkin.id == checkin_id).first()
+        return self.session.execute(_by_id_stmt(checkin_id)).scalars().first()
 
     def get_active_by_user(self, user_id: int) -> Optional[Checkin]:
-        return (
-            self.session.query(Checkin)
-            .options(joinedload(Checkin.projeto))
-            .filter(
-                Checkin.usuario_id == user_id,
-                Checkin.status == CheckinStatus.EM_ANDAMENTO
+        """Active check-in of a user, without its project (cached per repository)."""
+        if user_id not in self._active_checkin_cache:
+            self._active_checkin_cache[user_id] = (
+                self.session.execute(_active_by_user_stmt(user_id)).scalars().first()
             )
-            .first()
-        )
+        return self._active_checkin_cache[user_id]
+
+    def get_active_with_project(self, user_id: int) -> Optional[Checkin]:
+        """Active check-in of a user with projeto joined, for rendering."""
+        checkin = self.session.execute(
+            _active_by_user_stmt(user_id, with_project=True)
+        ).scalars().first()
+        self._active_checkin_cache[user_id] = checkin
+        return checkin
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Checkin]:
-        return (
-            self.session.query(Checkin)
-            .options(joinedload(Checkin.projeto))
-            .order_by(desc(Checkin.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
+    def get_with_cursor(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 10
+    ) -> Tuple[List[Checkin], Optional[int]]:
+        """
+        Keyset pagination over check-ins, newest first.
+        
+        Seeks past `cursor` (last seen ID) instead of using OFFSET, so every
+        page costs the same index range scan regardless of depth. Fetches
+        limit + 1 rows to detect whether a next page exists.
+        
+        Relationships other than projeto raise on access.
+        """
+        checkins = list(
+            self.session.execute(_history_stmt(cursor, limit)).scalars().all()
         )
+        
+        if len(checkins) > limit:
+            checkins = checkins[:limit]
+            return checkins, checkins[-1].id
+        
+        return checkins, None
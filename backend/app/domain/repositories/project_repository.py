@@ -15,7 +15,7 @@ Benefits:
 - Domain remains pure and framework-agnostic
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 from datetime import date
 
 from app.domain.entities.project import Project, ProjectStatus
@@ -39,15 +39,35 @@ class IProjectRepository(ABC):
         Persist a project (create or update).
         
         If project.id is None, creates new record.
-        If project.id exists, updates existing record.
+        If project.id exists, updates existing record - only if the stored
+        row is still at project.version (compare-and-set).
         
         Args:
             project: Domain entity to persist
             
         Returns:
-            Project with updated id and timestamps
+            Project with updated id, timestamps and version
             
         Raises:
+            ConcurrentModificationError: Row changed since project was read
+            RepositoryError: If persistence fails
+        """
+        pass
+    
+    @abstractmethod
+    def save_many(self, projects: Sequence[Project]) -> List[Project]:
+        """
+        Persist many projects (creates and updates) in one transaction.
+        
+        Same per-project rules as save(); if any project fails the whole
+        batch is rolled back.
+        
+        Returns:
+            Saved projects, in the order they were given
+            
+        Raises:
+            ProjectNotFoundError: An existing project no longer exists
+            ConcurrentModificationError: A row changed since it was read
             RepositoryError: If persistence fails
         """
         pass
@@ -67,6 +87,19 @@ class IProjectRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_many_by_ids(self, project_ids: Iterable[int]) -> Dict[int, Project]:
+        """
+        Retrieve many projects by ID in a single round-trip.
+        
+        Args:
+            project_ids: Project identifiers (duplicates are ignored)
+            
+        Returns:
+            Mapping of id -> Project; missing or soft-deleted IDs are absent
+        """
+        pass
+    
     @abstractmethod
     def get_all(
         self,
@@ -93,6 +126,25 @@ class IProjectRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_all(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Project]:
+        """
+        Stream every project matching the get_all() filters, ordered by id.
+        
+        For exports/analytics over the whole table: rows are fetched
+        chunk_size at a time, so memory does not grow with the result.
+        
+        Args:
+            chunk_size: Rows fetched per database round-trip
+        """
+        pass
+    
     @abstractmethod
     def get_by_client(self, client_id: int) -> List[Project]:
         """
@@ -103,6 +155,8 @@ class IProjectRepository(ABC):
             
         Returns:
             List of projects (excludes soft-deleted)
+            
+        Index: ix_projetos_live_cliente (cliente_id, id WHERE deleted_at IS NULL)
         """
         pass
     
@@ -115,6 +169,28 @@ class IProjectRepository(ABC):
             List of active projects
             
         Use Case: Dashboard showing current workload
+        
+        Index: ix_projetos_live_status_cliente (status, cliente_id, id
+        WHERE deleted_at IS NULL)
+        """
+        pass
+    
+    @abstractmethod
+    def get_active_projects_for_update(
+        self,
+        limit: int,
+        skip_locked: bool = True
+    ) -> List[Project]:
+        """
+        Lock and return up to `limit` active projects (oldest id first).
+        
+        For background workers: with skip_locked, rows already locked by
+        another worker are skipped instead of waited on, so concurrent
+        workers each claim a disjoint batch. Locks are held until the
+        caller's transaction ends; the repository does not commit.
+        
+        Returns:
+            Locked active projects
         """
         pass
     
@@ -132,22 +208,64 @@ class IProjectRepository(ABC):
             List of overdue projects
             
         Use Case: Manager dashboard, alerting system
+        
+        Index: ix_projetos_live_overdue (status, data_fim_prevista
+        WHERE deleted_at IS NULL)
+        """
+        pass
+    
+    @abstractmethod
+    def iter_overdue_projects(self, batch_size: int = 100) -> Iterator[List[Project]]:
+        """
+        Same rows as get_overdue_projects(), yielded in batches so a large
+        backlog never has to be held in memory at once.
+        
+        Args:
+            batch_size: Projects per yielded batch
         """
         pass
     
     @abstractmethod
-    def delete(self, project_id: int) -> bool:
+    def delete(self, project_id: int, owner_id: Optional[int] = None) -> bool:
         """
-        Soft delete a project (set deleted_at timestamp).
+        Delete a project.
         
         Business Rule: Soft delete preserves audit trail.
         Hard deletes should never happen in production.
         
         Args:
             project_id: Project to delete
+            owner_id: If given, only delete when this user is the project's
+                responsible. Checked in the same transaction as the delete,
+                so ownership cannot change in between.
             
         Returns:
             True if deleted, False if not found
+            
+        Raises:
+            ProjectAccessDeniedError: Project exists but owner_id doesn't own it
+        """
+        pass
+    
+    @abstractmethod
+    def bulk_transition(
+        self,
+        project_ids: List[int],
+        new_status: ProjectStatus,
+        allowed_from: Iterable[ProjectStatus],
+        owner_id: Optional[int] = None,
+        completion_date: Optional[date] = None
+    ) -> List[int]:
+        """
+        Move many projects to new_status in one transaction.
+        
+        Only projects currently in one of allowed_from (and, if owner_id
+        is given, whose responsible is owner_id) are updated; the rest
+        are left untouched. completion_date, if given, is stored as the
+        actual end date of every updated project.
+        
+        Returns:
+            IDs of the projects that were updated
         """
         pass
     
@@ -163,6 +281,45 @@ class IProjectRepository(ABC):
             Number of projects
             
         Use Case: Analytics, dashboard metrics
+        
+        Implementations must run a single SELECT COUNT(*) ... WHERE, never
+        materialize entities to count them.
+        """
+        pass
+    
+    @abstractmethod
+    def status_summary(self, today: date) -> tuple[dict[ProjectStatus, int], int]:
+        """
+        Aggregate counts for dashboards in a single query.
+        
+        Args:
+            today: Reference date for the overdue count
+            
+        Returns:
+            (non-deleted projects per status - every status present,
+             number of overdue projects as in get_overdue_projects)
+        """
+        pass
+    
+    @abstractmethod
+    def count(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
+    ) -> int:
+        """
+        Count projects matching the same filters as get_all().
+        
+        Args:
+            status: Filter by project status (optional)
+            client_id: Filter by client (optional)
+            responsible_id: Responsible user or contributor (optional)
+            
+        Returns:
+            Total number of matching projects
+            
+        Use Case: Pagination envelopes (total alongside one page of items)
         """
         pass
     
@@ -176,6 +333,10 @@ class IProjectRepository(ABC):
             
         Returns:
             True if exists and not deleted
+            
+        Implementations must run a single SELECT EXISTS(...), never load the
+        entity. Callers that need the project anyway should call get_by_id()
+        and check for None instead of exists() + get_by_id().
         """
         pass
 
@@ -193,6 +354,22 @@ class ProjectNotFoundError(RepositoryError):
         super().__init__(f"Project with ID {project_id} not found")
 
 
+class ProjectAccessDeniedError(RepositoryError):
+    """Raised when a guarded write targets a project the caller doesn't own."""
+    
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        super().__init__(f"Not allowed to modify project with ID {project_id}")
+
+
+class ConcurrentModificationError(RepositoryError):
+    """Raised when a project changed since it was read (stale version)."""
+    
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        super().__init__(f"Project with ID {project_id} was modified by another request")
+
+
 class ProjectAlreadyExistsError(RepositoryError):
     """Raised when attempting to create duplicate project."""
     
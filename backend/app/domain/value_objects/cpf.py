@@ -12,11 +12,16 @@ Algoritmo de Validação:
 Benefício: Impossível criar CPF inválido no sistema.
 """
 from dataclasses import dataclass
-import re
+from functools import lru_cache
 from typing import ClassVar
 
 
-@dataclass(frozen=True)
+# Formatting characters stripped from input ("123.456.789-10" -> digits);
+# anything else left over fails the 11-digit check
+_DIGIT_TRANS = str.maketrans('', '', '.-/ ')
+
+
+@dataclass(frozen=True, slots=True)
 class CPF:
     """
     Value Object representing a validated Brazilian CPF.
@@ -35,6 +40,8 @@ class CPF:
         '12345678910'
         >>> CPF("000.000.000-00")  # ← Raises ValueError (invalid)
         >>> CPF("123.456.789-99")  # ← Raises ValueError (wrong check digit)
+        >>> CPF.get("123.456.789-10") is CPF.get("12345678910")  # cached
+        True
     """
     
     value: str  # Stored normalized (digits only)
@@ -51,8 +58,15 @@ class CPF:
         if not self.value:
             raise ValueError("CPF cannot be empty")
         
-        # Remove formatting (keep only digits)
-        digits_only = re.sub(r'\D', '', self.value)
+        # Remove formatting (keep only digits); stored/DB values are
+        # already normalized and skip the translate
+        if len(self.value) == 11 and self.value.isascii() and self.value.isdigit():
+            digits_only = self.value
+        else:
+            digits_only = self.value.translate(_DIGIT_TRANS)
+        
+        if not (digits_only.isascii() and digits_only.isdigit()):
+            raise ValueError("CPF may only contain digits and '.', '-', '/' separators")
         
         # Length validation
         if len(digits_only) != 11:
@@ -69,29 +83,53 @@ class CPF:
         # Store normalized version
         object.__setattr__(self, 'value', digits_only)
     
+    @classmethod
+    def get(cls, raw: str) -> "CPF":
+        """
+        Shared, already-validated CPF for raw (formatted or not).
+        
+        Use instead of CPF(raw) where the same values are built repeatedly
+        (mapping stored rows): formatting is stripped first so "123.456.789-10"
+        and "12345678910" hit the same cache entry. Invalid input raises
+        ValueError and is not cached. Hit rate: CPF._get_normalized.cache_info().
+        """
+        return cls._get_normalized(raw.translate(_DIGIT_TRANS))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_normalized(digits: str) -> "CPF":
+        # Frozen and compared by value, so one instance can be shared
+        return CPF(digits)
+    
     @staticmethod
     def _validate_check_digits(cpf: str) -> bool:
         """
         Validate CPF check digits using mod-11 algorithm.
         
         Args:
-            cpf: CPF with 11 digits (string)
+            cpf: CPF with 11 ASCII digits (string)
             
         Returns:
             True if check digits are valid
         """
-        # Calculate first check digit
-        sum1 = sum(int(cpf[i]) * (10 - i) for i in range(9))
-        digit1 = 0 if sum1 % 11 < 2 else 11 - (sum1 % 11)
+        # One pass to ints (ASCII '0' == 48), then both weighted sums
+        # unrolled: weights 10..2 for the first digit, 11..2 for the second
+        d0, d1, d2, d3, d4, d5, d6, d7, d8, d9, d10 = (
+            c - 48 for c in cpf.encode('ascii')
+        )
         
-        if int(cpf[9]) != digit1:
+        # Calculate first check digit
+        sum1 = (d0 * 10 + d1 * 9 + d2 * 8 + d3 * 7 + d4 * 6
+                + d5 * 5 + d6 * 4 + d7 * 3 + d8 * 2)
+        rem1 = sum1 % 11
+        if d9 != (0 if rem1 < 2 else 11 - rem1):
             return False
         
         # Calculate second check digit
-        sum2 = sum(int(cpf[i]) * (11 - i) for i in range(10))
-        digit2 = 0 if sum2 % 11 < 2 else 11 - (sum2 % 11)
-        
-        return int(cpf[10]) == digit2
+        sum2 = (d0 * 11 + d1 * 10 + d2 * 9 + d3 * 8 + d4 * 7
+                + d5 * 6 + d6 * 5 + d7 * 4 + d8 * 3 + d9 * 2)
+        rem2 = sum2 % 11
+        return d10 == (0 if rem2 < 2 else 11 - rem2)
     
     @property
     def formatted(self) -> str:
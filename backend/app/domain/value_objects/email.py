@@ -11,12 +11,35 @@ Características de Value Objects:
 
 Benefício: Impossível criar Email inválido.
 """
-from dataclasses import dataclass
-import re
-from typing import ClassVar
+from dataclasses import dataclass, field
+import string
 
 
-@dataclass(frozen=True)
+# Translation tables that delete every allowed character: whatever is left
+# after translate() is invalid. Same charsets as the former regex
+# ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$
+_ALNUM = string.ascii_letters + string.digits
+_LOCAL_INVALID = str.maketrans('', '', _ALNUM + '._%+-')
+_DOMAIN_INVALID = str.maketrans('', '', _ALNUM + '.-')
+
+
+def _is_valid_email(value: str) -> bool:
+    """Single-pass scan equivalent to the basic RFC 5322 pattern above."""
+    at = value.find('@')
+    if at < 1:
+        return False
+    local, domain = value[:at], value[at + 1:]
+    
+    # Neither charset contains '@', so a second one fails here too
+    if local.translate(_LOCAL_INVALID) or domain.translate(_DOMAIN_INVALID):
+        return False
+    
+    # host.tld: non-empty host, alphabetic TLD of 2+ letters
+    host, dot, tld = domain.rpartition('.')
+    return bool(host) and len(tld) >= 2 and tld.isalpha()
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """
     Value Object representing a validated email address.
@@ -35,10 +58,10 @@ class Email:
     
     value: str
     
-    # Regex pattern for basic email validation
-    EMAIL_PATTERN: ClassVar[re.Pattern] = re.compile(
-        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    )
+    # Derived once in __post_init__ (frozen: read-only afterwards)
+    _local: str = field(init=False, repr=False, compare=False)
+    _domain: str = field(init=False, repr=False, compare=False)
+    _lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate email on construction - fail fast principle."""
@@ -48,18 +71,23 @@ class Email:
         if len(self.value) > 254:
             raise ValueError("Email exceeds maximum length (254 characters)")
         
-        if not self.EMAIL_PATTERN.match(self.value):
+        if not _is_valid_email(self.value):
             raise ValueError(f"Invalid email format: {self.value}")
+        
+        at = self.value.index('@')
+        object.__setattr__(self, '_local', self.value[:at])
+        object.__setattr__(self, '_domain', self.value[at + 1:])
+        object.__setattr__(self, '_lower', self.value.lower())
     
     @property
     def local_part(self) -> str:
         """Get part before @ symbol."""
-        return self.value.split('@')[0]
+        return self._local
     
     @property
     def domain(self) -> str:
         """Get part after @ symbol."""
-        return self.value.split('@')[1]
+        return self._domain
     
     def __str__(self) -> str:
         """String representation."""
@@ -69,11 +97,11 @@ class Email:
         """Email comparison is case-insensitive."""
         if not isinstance(other, Email):
             return False
-        return self.value.lower() == other.value.lower()
+        return self._lower == other._lower
     
     def __hash__(self) -> int:
         """Hash for use in sets/dicts."""
-        return hash(self.value.lower())
+        return hash(self._lower)
 
 
 # Example usage in domain entity:
@@ -19,7 +19,12 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Union
 
 
-@dataclass(frozen=True)
+# Parsed once instead of on every construction/comparison
+_CENT = Decimal("0.01")
+_ZERO = Decimal(0)
+
+
+@dataclass(frozen=True, slots=True)
 class Money:
     """
     Value Object representing monetary amount.
@@ -35,7 +40,7 @@ class Money:
         >>> tax = Money(0.50)
         >>> total = price + tax
         >>> print(total)
-        'R$ 11.49'
+        'R$ 11,49'
         >>> Money(-5)  # ← Raises ValueError
     """
     
@@ -50,11 +55,17 @@ class Money:
             amount: Monetary value (converts to Decimal)
             currency: ISO currency code (default BRL for Brazilian Real)
         """
-        # Convert to Decimal and round to 2 decimal places
-        decimal_amount = Decimal(str(amount)).quantize(
-            Decimal("0.01"), 
-            rounding=ROUND_HALF_UP
-        )
+        # Convert to Decimal: ints, strings and Decimals are exact as-is;
+        # floats go through repr() so 0.1 means "0.1", not its binary value
+        if isinstance(amount, Decimal):
+            decimal_amount = amount
+        elif isinstance(amount, (int, str)):
+            decimal_amount = Decimal(amount)
+        else:
+            decimal_amount = Decimal(repr(amount))
+        
+        # Round to 2 decimal places
+        decimal_amount = decimal_amount.quantize(_CENT, rounding=ROUND_HALF_UP)
         
         # Validate
         if decimal_amount < 0:
@@ -64,13 +75,26 @@ class Money:
         object.__setattr__(self, 'amount', decimal_amount)
         object.__setattr__(self, 'currency', currency)
     
+    @classmethod
+    def _unchecked(cls, amount: Decimal, currency: str) -> 'Money':
+        """
+        Build Money from an amount already quantized to 2dp and >= 0.
+        
+        Internal: skips conversion, rounding and validation in __init__.
+        """
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'amount', amount)
+        object.__setattr__(obj, 'currency', currency)
+        return obj
+    
     def __add__(self, other: 'Money') -> 'Money':
         """Add two Money values."""
         if not isinstance(other, Money):
             raise TypeError(f"Cannot add Money with {type(other)}")
         if self.currency != other.currency:
             raise ValueError(f"Currency mismatch: {self.currency} vs {other.currency}")
-        return Money(self.amount + other.amount, self.currency)
+        # Sum of two non-negative 2dp amounts: already valid, skip __init__
+        return Money._unchecked(self.amount + other.amount, self.currency)
     
     def __sub__(self, other: 'Money') -> 'Money':
         """Subtract Money values."""
@@ -81,7 +105,7 @@ class Money:
         result = self.amount - other.amount
         if result < 0:
             raise ValueError("Subtraction would result in negative Money")
-        return Money(result, self.currency)
+        return Money._unchecked(result, self.currency)
     
     def __mul__(self, multiplier: Union[int, float, Decimal]) -> 'Money':
         """Multiply Money by scalar (e.g., quantity * price)."""
@@ -118,7 +142,10 @@ class Money:
     def __str__(self) -> str:
         """Format for display."""
         if self.currency == "BRL":
-            return f"R$ {self.amount:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+            # Amount is a non-negative 2dp Decimal: split into reais and
+            # centavos and join with Brazilian separators in one pass
+            reais, centavos = divmod(int(self.amount.scaleb(2)), 100)
+            return f"R$ {reais:_},{centavos:02d}".replace('_', '.')
         return f"{self.currency} {self.amount:,.2f}"
     
     def __repr__(self) -> str:
@@ -128,7 +155,7 @@ class Money:
     @property
     def is_zero(self) -> bool:
         """Check if amount is zero."""
-        return self.amount == Decimal("0.00")
+        return self.amount == _ZERO
     
     def to_float(self) -> float:
         """Convert to float (use only for serialization, not calculations)."""
@@ -10,12 +10,20 @@ Problema que resolve:
 
 Benefício: Impossível criar projeto com nome inválido.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
+import string
 from typing import ClassVar
 
 
-@dataclass(frozen=True)
+# Equivalent of ^[a-zA-Z0-9][a-zA-Z0-9\s\-_\.]*$ without the regex engine:
+# an ASCII alphanumeric first character, then nothing left over after
+# deleting the allowed ASCII characters except whitespace (\s)
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+_DELETE_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + '-_.')
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectName:
     """
     Value Object representing a validated project name.
@@ -38,9 +46,14 @@ class ProjectName:
     
     value: str
     
+    # Derived once in __post_init__ (frozen: read-only afterwards)
+    _initials: str = field(init=False, repr=False, compare=False)
+    _length: int = field(init=False, repr=False, compare=False)
+    
     # Constants
     MIN_LENGTH: ClassVar[int] = 3
     MAX_LENGTH: ClassVar[int] = 200
+    # Deprecated: validation no longer uses it; kept for external callers
     PATTERN: ClassVar[re.Pattern] = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9\s\-_\.]*$")
     
     def __post_init__(self):
@@ -67,7 +80,8 @@ class ProjectName:
             )
         
         # Pattern validation
-        if not self.PATTERN.match(trimmed):
+        leftover = trimmed.translate(_DELETE_ALLOWED)
+        if trimmed[0] not in _ALNUM or (leftover and not leftover.isspace()):
             raise ValueError(
                 "Project name must start with alphanumeric character and "
                 "contain only letters, numbers, spaces, hyphens, underscores, dots"
@@ -75,11 +89,15 @@ class ProjectName:
         
         # Update value with trimmed version (bypass frozen restriction)
         object.__setattr__(self, 'value', trimmed)
+        object.__setattr__(
+            self, '_initials', ''.join(word[0].upper() for word in trimmed.split())
+        )
+        object.__setattr__(self, '_length', len(trimmed))
     
     @property
     def length(self) -> int:
         """Get name length."""
-        return len(self.value)
+        return self._length
     
     @property
     def initials(self) -> str:
@@ -89,8 +107,7 @@ class ProjectName:
         Example:
             ProjectName("Cloud Migration Project") → "CMP"
         """
-        words = self.value.split()
-        return ''.join(word[0].upper() for word in words if word)
+        return self._initials
     
     def contains(self, substring: str, case_sensitive: bool = False) -> bool:
         """Check if name contains substring."""
@@ -108,7 +125,7 @@ class ProjectName:
     
     def __len__(self) -> int:
         """Support len() function."""
-        return len(self.value)
+        return self._length
 
 
 # Example usage in domain entity:
@@ -1,9 +1,36 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import lambda_stmt, or_, select
 from app.models.client import Client
 from app.schemas.client import ClientCreate
 
+
+# Module-level statement builders: cached across requests by lambda_stmt,
+# with closure values extracted as bound parameters.
+def _search_stmt(pattern: str, limit: int):
+    return lambda_stmt(
+        lambda: select(Client)
+        .where(
+            or_(
+                Client.nome.ilike(pattern),
+                Client.cnpj.ilike(pattern)
+            ),
+            Client.deleted_at.is_(None)
+        )
+        .order_by(Client.nome.asc())
+        .limit(limit)
+    )
+
+
+def _list_stmt(skip: int, limit: int):
+    return lambda_stmt(
+        lambda: select(Client)
+        .where(Client.deleted_at.is_(None))
+        .offset(skip)
+        .limit(limit)
+    )
+
+
 class SQLAlchemyClientRepository:
     def __init__(self, session: Session):
         self.session = session
@@ -30,25 +57,9 @@ class SQLAlchemyClientRepository:
         return db_client
 
     def search(self, query: str, limit: int = 10) -> List[Client]:
-        return (
-            self.session.query(Client)
-            .filter(
-                or_(
-                    Client.nome.ilike(f"%{query}%"),
-                    Client.cnpj.ilike(f"%{query}%")
-                )
-            )
-            .filter(Client.deleted_at.is_(None))
-            .order_by(Client.nome.asc())
-            .limit(limit)
-            .all()
+        return list(
+            self.session.execute(_search_stmt(f"%{query}%", limit)).scalars().all()
         )
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        return (
-            self.session.query(Client)
-            .filter(Client.deleted_at.is_(None))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return list(self.session.execute(_list_stmt(skip, limit)).scalars().all())
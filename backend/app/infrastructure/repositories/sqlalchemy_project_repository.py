@@ -18,13 +18,16 @@ Critical: This is the ONLY place where we map between:
 - app.domain.entities.project.Project (domain)
 - app.models.project.Project (ORM model)
 """
-from typing import List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence
 from datetime import date, datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy import case, exists, func, lambda_stmt, or_, select, update
 
 from app.domain.repositories.project_repository import (
+    ConcurrentModificationError,
     IProjectRepository,
+    ProjectAccessDeniedError,
     ProjectNotFoundError,
     RepositoryError
 )
@@ -35,7 +38,50 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 
-class SQLAlchemyProjectRepository(IProjectRepository):
+# Hot single-row lookup: lambda_stmt caches the built statement and its
+# compiled SQL process-wide; project_id becomes a bound parameter. Loader
+# options match _active_query().
+def _active_by_id_stmt(project_id: int):
+    return lambda_stmt(
+        lambda: select(ORMProject)
+        .options(
+            joinedload(ORMProject.client),
+            joinedload(ORMProject.responsavel),
+            selectinload(ORMProject.contributors)
+        )
+        .where(ORMProject.id == project_id, ORMProject.deleted_at.is_(None))
+    )
+
+
+class _ScalarQueryMixin:
+    """
+    Existence/count checks as single scalar queries (no entity loads).
+    
+    Equality filters are passed as column=value keyword arguments; soft
+    deleted rows are excluded when the model has deleted_at.
+    """
+    
+    session: Session
+    
+    @staticmethod
+    def _scalar_where(model, eq: Dict[str, Any]) -> list:
+        criteria = [getattr(model, name) == value for name, value in eq.items()]
+        if hasattr(model, "deleted_at"):
+            criteria.append(model.deleted_at.is_(None))
+        return criteria
+    
+    def _scalar_exists(self, model, **eq: Any) -> bool:
+        """SELECT EXISTS (SELECT 1 FROM model WHERE ...)."""
+        stmt = select(exists().where(*self._scalar_where(model, eq)))
+        return bool(self.session.execute(stmt).scalar())
+    
+    def _scalar_count(self, model, **eq: Any) -> int:
+        """SELECT COUNT(*) FROM model WHERE ..."""
+        stmt = select(func.count()).select_from(model).where(*self._scalar_where(model, eq))
+        return self.session.execute(stmt).scalar() or 0
+
+
+class SQLAlchemyProjectRepository(_ScalarQueryMixin, IProjectRepository):
     """
     SQLAlchemy implementation of project repository.
     
@@ -70,21 +116,23 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         Returns:
             Domain entity
         """
-        domain_project = DomainProject(
+        # Stored rows were validated on write: skip __post_init__
+        domain_project = DomainProject.from_persistence(
             id=orm_project.id,
             name=orm_project.nome,
             description=orm_project.descricao,
             start_date=orm_project.data_inicio,
             end_date_planned=orm_project.data_fim_prevista,
             end_date_actual=orm_project.data_fim_real,
-            status=ProjectStatus(orm_project.status.value),  # Enum conversion
+            status=ProjectStatus.parse(orm_project.status.value),  # Enum conversion
             client_id=orm_project.cliente_id,
             responsible_user_id=orm_project.responsavel_id,
             observations=orm_project.observacoes,
             estimated_value=orm_project.valor_estimado,
             created_at=orm_project.created_at,
             updated_at=orm_project.updated_at,
-            deleted_at=orm_project.deleted_at
+            deleted_at=orm_project.deleted_at,
+            version=orm_project.version
         )
 
         # Populate transient fields if loaded
@@ -153,6 +201,52 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         orm_project.valor_estimado = domain_project.estimated_value
         orm_project.updated_at = func.now()
     
+    def _active_query(self):
+        """
+        Base query for non-deleted projects with every relationship that
+        _to_domain() touches loaded up front.
+
+        client/responsavel are many-to-one and ride along in the same SELECT
+        (joinedload). contributors is a collection, so it is fetched with a
+        single extra ``WHERE project_id IN (...)`` query (selectinload) instead
+        of one lazy load per row - joining it would also multiply rows and
+        break LIMIT.
+        """
+        return (
+            self.session.query(ORMProject)
+            .options(
+                joinedload(ORMProject.client),
+                joinedload(ORMProject.responsavel),
+                selectinload(ORMProject.contributors)
+            )
+            .filter(ORMProject.deleted_at.is_(None))
+        )
+
+    def _apply_filters(
+        self,
+        query,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
+    ):
+        """Apply the list filters shared by get_all, get_with_cursor and count."""
+        if status:
+            from app.models.project import ProjectStatus as ORMProjectStatus
+            query = query.filter(ORMProject.status == ORMProjectStatus(status.value))
+        
+        if client_id:
+            query = query.filter(ORMProject.cliente_id == client_id)
+
+        if responsible_id:
+            query = query.filter(
+                or_(
+                    ORMProject.responsavel_id == responsible_id,
+                    ORMProject.contributors.any(id=responsible_id)
+                )
+            )
+        
+        return query
+    
     # ========================================
     # IProjectRepository Implementation
     # ========================================
@@ -181,6 +275,12 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                 if not orm_project:
                     raise ProjectNotFoundError(project.id)
                 
+                # Changed since the caller read it: refuse to overwrite
+                if orm_project.version != project.version:
+                    raise ConcurrentModificationError(project.id)
+                
+                # version_id_col makes the flush "UPDATE ... WHERE version=?"
+                # and bumps it, closing the window between this read and write
                 self._update_orm(orm_project, project)
                 self.session.commit() # Commit transaction
                 self.session.refresh(orm_project)
@@ -189,23 +289,102 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                 
                 return self._to_domain(orm_project)
                 
-        except ProjectNotFoundError:
+        except StaleDataError as e:
+            self.session.rollback()
+            logger.warning("project_update_conflict", project_id=project.id)
+            raise ConcurrentModificationError(project.id) from e
+        except (ProjectNotFoundError, ConcurrentModificationError):
+            self.session.rollback()
             raise
         except Exception as e:
             logger.error("project_save_failed", error=str(e), exc_info=True)
             raise RepositoryError(f"Failed to save project: {str(e)}") from e
     
+    def save_many(self, projects: Sequence[DomainProject]) -> List[DomainProject]:
+        """Persist a batch of projects in one transaction.
+
+        New projects go through add_all and one flush. Their generated IDs
+        are needed, so on MySQL (no RETURNING) the flush still runs one
+        INSERT per row; backends with INSERT..RETURNING get batched
+        multi-row INSERTs. Existing rows are loaded with one IN query,
+        version-checked, and flushed as ordinary versioned UPDATEs (bulk
+        UPDATE statements would bypass version_id_col). Results are re-read
+        with one eager-loaded query instead of a refresh per row.
+        """
+        if not projects:
+            return []
+        
+        new_orm = [self._to_orm(p) for p in projects if p.id is None]
+        existing = [p for p in projects if p.id is not None]
+        
+        try:
+            if existing:
+                rows = {
+                    row.id: row
+                    for row in self.session.execute(
+                        select(ORMProject).where(
+                            ORMProject.id.in_([p.id for p in existing]),
+                            ORMProject.deleted_at.is_(None)
+                        )
+                    ).scalars()
+                }
+                for project in existing:
+                    orm_project = rows.get(project.id)
+                    if orm_project is None:
+                        raise ProjectNotFoundError(project.id)
+                    if orm_project.version != project.version:
+                        raise ConcurrentModificationError(project.id)
+                    self._update_orm(orm_project, project)
+            
+            self.session.add_all(new_orm)
+            self.session.flush()
+            
+            # IDs are known after the flush; keep the caller's order
+            new_ids = iter([orm.id for orm in new_orm])
+            ids = [p.id if p.id is not None else next(new_ids) for p in projects]
+            self.session.commit()
+            
+            saved = self.get_many_by_ids(ids)
+            
+            logger.info("projects_saved", created=len(new_orm), updated=len(existing))
+            return [saved[project_id] for project_id in ids]
+            
+        except StaleDataError as e:
+            self.session.rollback()
+            # The flush doesn't say which UPDATE matched no row: re-read the
+            # versions and report the first project that moved on (or is gone)
+            stale_id = self._first_stale_id(existing)
+            logger.warning(
+                "project_batch_update_conflict", count=len(existing), project_id=stale_id
+            )
+            raise ConcurrentModificationError(stale_id) from e
+        except (ProjectNotFoundError, ConcurrentModificationError):
+            self.session.rollback()
+            raise
+        except Exception as e:
+            self.session.rollback()
+            logger.error("project_save_many_failed", error=str(e), exc_info=True)
+            raise RepositoryError(f"Failed to save projects: {str(e)}") from e
+    
+    def _first_stale_id(self, projects: Sequence[DomainProject]) -> int:
+        """ID of the first project whose stored version no longer matches."""
+        current = dict(
+            self.session.execute(
+                select(ORMProject.id, ORMProject.version).where(
+                    ORMProject.id.in_([p.id for p in projects])
+                )
+            ).all()
+        )
+        return next(
+            (p.id for p in projects if current.get(p.id) != p.version),
+            projects[0].id
+        )
+    
     def get_by_id(self, project_id: int) -> Optional[DomainProject]:
         """Retrieve project by ID with eager loading."""
         try:
             orm_project = (
-                self.session.query(ORMProject)
-                .options(
-                    joinedload(ORMProject.client),  # Prevent N+1
-                    joinedload(ORMProject.responsavel)
-                )
-                .filter_by(id=project_id, deleted_at=None)
-                .first()
+                self.session.execute(_active_by_id_stmt(project_id)).scalars().first()
             )
             
             if not orm_project:
@@ -217,6 +396,21 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             logger.error("project_get_failed", project_id=project_id, error=str(e))
             raise RepositoryError(f"Failed to get project: {str(e)}") from e
     
+    def get_many_by_ids(self, project_ids: Iterable[int]) -> Dict[int, DomainProject]:
+        """Retrieve many projects with one eager-loaded IN query."""
+        ids = list(dict.fromkeys(project_ids))
+        if not ids:
+            return {}
+        
+        try:
+            return {
+                orm_project.id: self._to_domain(orm_project)
+                for orm_project in self._active_query().filter(ORMProject.id.in_(ids))
+            }
+        except Exception as e:
+            logger.error("project_get_many_failed", count=len(ids), error=str(e))
+            raise RepositoryError(f"Failed to get projects: {str(e)}") from e
+    
     def get_all(
         self,
         skip: int = 0,
@@ -232,33 +426,12 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         OFFSET pagination degrades with deep pages (O(n) complexity).
         """
         try:
-            query = (
-                self.session.query(ORMProject)
-                .options(
-                    joinedload(ORMProject.client),
-                    joinedload(ORMProject.responsavel)
-                )
-                .filter(ORMProject.deleted_at.is_(None))
+            query = self._apply_filters(
+                self._active_query(), status, client_id, responsible_id
             )
             
-            # Apply filters
-            if status:
-                from app.models.project import ProjectStatus as ORMProjectStatus
-                query = query.filter(ORMProject.status == ORMProjectStatus(status.value))
-            
-            if client_id:
-                query = query.filter(ORMProject.cliente_id == client_id)
-
-            if responsible_id:
-                query = query.filter(
-                    or_(
-                        ORMProject.responsavel_id == responsible_id,
-                        ORMProject.contributors.any(id=responsible_id)
-                    )
-                )
-            
-            # Pagination
-            orm_projects = query.offset(skip).limit(limit).all()
+            # Pagination (stable order so pages never overlap or skip rows)
+            orm_projects = query.order_by(ORMProject.id).offset(skip).limit(limit).all()
             
             return [self._to_domain(p) for p in orm_projects]
             
@@ -266,12 +439,59 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             logger.error("project_list_failed", error=str(e), exc_info=True)
             raise RepositoryError(f"Failed to list projects: {str(e)}") from e
     
+    def iter_all(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[DomainProject]:
+        """
+        Every matching project, one at a time, fetched in keyset chunks.
+
+        Same trade-off as iter_overdue_projects(): no server-side cursor
+        (yield_per/stream_results), because on MySQL an unbuffered result
+        holds the connection and the per-chunk contributors selectinload
+        could not run. Each chunk's project rows are mapped and expunged
+        before it is yielded, so memory is bounded by chunk_size (plus the
+        distinct clients/users they reference, which stay in the session).
+        """
+        last_id = 0
+        try:
+            while True:
+                orm_projects = (
+                    self._apply_filters(
+                        self._active_query(), status, client_id, responsible_id
+                    )
+                    .filter(ORMProject.id > last_id)
+                    .order_by(ORMProject.id)
+                    .limit(chunk_size)
+                    .all()
+                )
+                if not orm_projects:
+                    return
+                
+                last_id = orm_projects[-1].id
+                chunk = [self._to_domain(p) for p in orm_projects]
+                # Only this chunk's rows: the session is the caller's and may
+                # hold unrelated objects (e.g. the current user)
+                for orm_project in orm_projects:
+                    self.session.expunge(orm_project)
+                yield from chunk
+                
+                if len(orm_projects) < chunk_size:
+                    return
+        except Exception as e:
+            logger.error("project_stream_failed", error=str(e))
+            raise RepositoryError(f"Failed to stream projects: {str(e)}") from e
+    
     def get_with_cursor(
         self,
         cursor: Optional[int] = None,
         limit: int = 20,
         status: Optional[ProjectStatus] = None,
-        client_id: Optional[int] = None
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
     ) -> tuple[List[DomainProject], Optional[int]]:
         """
         Get projects with CURSOR-BASED pagination (high performance).
@@ -286,6 +506,7 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             limit: Page size (default 20, max 100)
             status: Filter by status
             client_id: Filter by client
+            responsible_id: Filter by responsible user or contributor
             
         Returns:
             Tuple of (projects, next_cursor)
@@ -300,26 +521,13 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             projects, cursor = repo.get_with_cursor(cursor=cursor, limit=20)
         """
         try:
-            query = (
-                self.session.query(ORMProject)
-                .options(
-                    joinedload(ORMProject.client),
-                    joinedload(ORMProject.responsavel)
-                )
-                .filter(ORMProject.deleted_at.is_(None))
-            )
+            query = self._active_query()
             
             # Cursor filtering (keyset pagination)
             if cursor is not None:
                 query = query.filter(ORMProject.id > cursor)
             
-            # Apply filters
-            if status:
-                from app.models.project import ProjectStatus as ORMProjectStatus
-                query = query.filter(ORMProject.status == ORMProjectStatus(status.value))
-            
-            if client_id:
-                query = query.filter(ORMProject.cliente_id == client_id)
+            query = self._apply_filters(query, status, client_id, responsible_id)
             
             # Order by ID (CRITICAL: must match cursor column)
             query = query.order_by(ORMProject.id)
@@ -359,24 +567,45 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         """Get currently active projects."""
         return self.get_all(status=ProjectStatus.EM_ANDAMENTO, limit=1000)
     
-    def get_overdue_projects(self) -> List[DomainProject]:
-        """Get overdue projects (past planned end date and still active)."""
+    def get_active_projects_for_update(
+        self,
+        limit: int,
+        skip_locked: bool = True
+    ) -> List[DomainProject]:
+        """Claim up to `limit` active projects with SELECT ... FOR UPDATE [SKIP LOCKED].
+
+        Does not commit: the row locks last until the caller's transaction
+        ends. Relationships come from separate selectin queries because
+        PostgreSQL refuses FOR UPDATE on the nullable side of the outer
+        joins joinedload would add; `of` limits the lock to projetos rows.
+        """
+        from app.models.project import ProjectStatus as ORMProjectStatus
+        
         try:
-            from app.models.project import ProjectStatus as ORMProjectStatus
-            
-            orm_projects = (
-                self.session.query(ORMProject)
+            stmt = (
+                select(ORMProject)
                 .options(
-                    joinedload(ORMProject.client),
-                    joinedload(ORMProject.responsavel)
+                    selectinload(ORMProject.client),
+                    selectinload(ORMProject.responsavel),
+                    selectinload(ORMProject.contributors)
                 )
-                .filter(
+                .where(
                     ORMProject.status == ORMProjectStatus.EM_ANDAMENTO,
-                    ORMProject.data_fim_prevista < date.today(),
                     ORMProject.deleted_at.is_(None)
                 )
-                .all()
+                .order_by(ORMProject.id)
+                .limit(limit)
+                .with_for_update(of=ORMProject, skip_locked=skip_locked)
             )
+            return [self._to_domain(p) for p in self.session.execute(stmt).scalars()]
+        except Exception as e:
+            logger.error("active_projects_claim_failed", error=str(e))
+            raise RepositoryError(f"Failed to lock active projects: {str(e)}") from e
+    
+    def get_overdue_projects(self) -> List[DomainProject]:
+        """Get overdue projects (past planned end date and still active)."""
+        try:
+            orm_projects = self._active_query().filter(ORMProject.is_overdue).all()
             
             return [self._to_domain(p) for p in orm_projects]
             
@@ -384,6 +613,48 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             logger.error("overdue_projects_query_failed", error=str(e))
             raise RepositoryError(f"Failed to get overdue projects: {str(e)}") from e
 
+    def iter_overdue_projects(self, batch_size: int = 100) -> Iterator[List[DomainProject]]:
+        """
+        Overdue projects in keyset batches (WHERE id > last ORDER BY id LIMIT n).
+
+        Not a server-side cursor (yield_per): on MySQL an unbuffered result
+        blocks the connection, so the per-batch selectinload of contributors
+        could not run until the whole result was read. Each batch is mapped
+        and expunged before the next, keeping memory flat.
+
+        Runs on its own session (same engine as this repository's), opened on
+        the first batch and closed when the generator finishes or is closed:
+        a streamed body outlives the request's get_db() scope, so it must not
+        use or close the request session.
+        """
+        session = Session(bind=self.session.get_bind(), autoflush=False)
+        stream = type(self)(session)
+        last_id = 0
+        try:
+            while True:
+                orm_projects = (
+                    stream._active_query()
+                    .filter(ORMProject.is_overdue, ORMProject.id > last_id)
+                    .order_by(ORMProject.id)
+                    .limit(batch_size)
+                    .all()
+                )
+                if not orm_projects:
+                    return
+                
+                last_id = orm_projects[-1].id
+                batch = [stream._to_domain(p) for p in orm_projects]
+                session.expunge_all()
+                yield batch
+                
+                if len(orm_projects) < batch_size:
+                    return
+        except Exception as e:
+            logger.error("overdue_projects_stream_failed", error=str(e))
+            raise RepositoryError(f"Failed to stream overdue projects: {str(e)}") from e
+        finally:
+            session.close()
+
     def add_contributor(self, project_id: int, user_id: int) -> None:
         """Add a user as a contributor to a project."""
         try:
@@ -438,16 +709,36 @@ class SQLAlchemyProjectRepository(IProjectRepository):
         except Exception as e:
             raise RepositoryError(f"Failed to get contributors: {str(e)}") from e
     
-    def delete(self, project_id: int) -> bool:
+    def delete(self, project_id: int, owner_id: Optional[int] = None) -> bool:
         """Hard delete project (physical row removal).
 
         Note: Previously implemented soft delete via deleted_at timestamp.
         Business requirement now demands permanent removal.
+
+        The project row is locked (SELECT ... FOR UPDATE) before anything is
+        removed, and the ownership check reads the locked row, so a concurrent
+        reassignment cannot slip between authorization and delete.
         """
         try:
             from sqlalchemy import text
             
             logger.info("starting_project_hard_delete", project_id=project_id)
+
+            # 0. Lock the row and authorize in one round-trip
+            responsavel_id = self.session.execute(
+                select(ORMProject.responsavel_id)
+                .where(ORMProject.id == project_id, ORMProject.deleted_at.is_(None))
+                .with_for_update()
+            ).scalar_one_or_none()
+
+            if responsavel_id is None:
+                logger.warning("project_not_found_for_deletion", project_id=project_id)
+                self.session.rollback()
+                return False
+
+            if owner_id is not None and responsavel_id != owner_id:
+                self.session.rollback()
+                raise ProjectAccessDeniedError(project_id)
             
             # Note: We are NOT using SET FOREIGN_KEY_CHECKS=0 because it requires SUPER privileges
             # which might not be available in shared hosting environments.
@@ -464,55 +755,36 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                 logger.error("delete_contributors_failed", project_id=project_id, error=str(e), exc_info=True)
                 raise RepositoryError(f"Failed to delete contributors: {str(e)}") from e
             
-            # Pre-fetch IDs to avoid empty IN () clauses which cause SQL syntax errors
+            # Which dependent tables have rows at all: one round-trip with two
+            # EXISTS flags instead of fetching every checkin and sprint id
             try:
-                checkin_ids_result = self.session.execute(
-                    text("SELECT id FROM checkins WHERE projeto_id = :pid"),
+                has_checkins, has_sprints = self.session.execute(
+                    text(
+                        "SELECT EXISTS (SELECT 1 FROM checkins WHERE projeto_id = :pid), "
+                        "EXISTS (SELECT 1 FROM sprints WHERE project_id = :pid)"
+                    ),
                     {"pid": project_id}
-                ).fetchall()
-                checkin_ids = [row[0] for row in checkin_ids_result]
+                ).one()
                 
-                sprint_ids_result = self.session.execute(
-                    text("SELECT id FROM sprints WHERE project_id = :pid"),
-                    {"pid": project_id}
-                ).fetchall()
-                sprint_ids = [row[0] for row in sprint_ids_result]
-                
-                logger.info("fetched_dependency_ids", project_id=project_id, checkin_count=len(checkin_ids), sprint_count=len(sprint_ids))
+                logger.info("checked_project_dependencies", project_id=project_id, has_checkins=bool(has_checkins), has_sprints=bool(has_sprints))
             except Exception as e:
-                logger.error("fetch_dependency_ids_failed", project_id=project_id, error=str(e), exc_info=True)
-                raise RepositoryError(f"Failed to fetch dependency IDs: {str(e)}") from e
+                logger.error("check_project_dependencies_failed", project_id=project_id, error=str(e), exc_info=True)
+                raise RepositoryError(f"Failed to check project dependencies: {str(e)}") from e
 
             # 2. Delete attachments linked to project checkins (Deep dependency)
-            if checkin_ids:
+            if has_checkins:
                 try:
                     logger.info("deleting_project_attachments", project_id=project_id)
-                    # Use tuple(checkin_ids) for IN clause, but handle single item tuple correctly
-                    if len(checkin_ids) == 1:
-                        self.session.execute(
-                            text("DELETE FROM anexos WHERE checkin_id = :cid"),
-                            {"cid": checkin_ids[0]}
-                        )
-                    else:
-                        # SQLAlchemy text() with bindparams for list is safer but complex with raw SQL
-                        # For simplicity in this specific fix context, we'll use the subquery approach again
-                        # BUT we know checkins exist, so the subquery won't be empty.
-                        # Actually, let's stick to the subquery approach which is standard SQL, 
-                        # but now we know it's safe because we checked checkin_ids exists? 
-                        # No, the subquery is safe even if empty result, BUT `IN ()` is invalid.
-                        # The original query `IN (SELECT ...)` is valid even if SELECT returns nothing.
-                        # The issue might be something else. 
-                        # However, let's keep the granular try/except.
-                        self.session.execute(
-                            text("DELETE FROM anexos WHERE checkin_id IN (SELECT id FROM checkins WHERE projeto_id = :pid)"),
-                            {"pid": project_id}
-                        )
+                    self.session.execute(
+                        text("DELETE FROM anexos WHERE checkin_id IN (SELECT id FROM checkins WHERE projeto_id = :pid)"),
+                        {"pid": project_id}
+                    )
                 except Exception as e:
                     logger.error("delete_attachments_failed", project_id=project_id, error=str(e), exc_info=True)
                     raise RepositoryError(f"Failed to delete attachments: {str(e)}") from e
             
             # 3. Delete executed tasks linked to project checkins (Deep dependency)
-            if checkin_ids:
+            if has_checkins:
                 try:
                     logger.info("deleting_project_executed_tasks", project_id=project_id)
                     self.session.execute(
@@ -524,7 +796,7 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                     raise RepositoryError(f"Failed to delete executed tasks: {str(e)}") from e
             
             # 4. Delete checkins (Direct dependency)
-            if checkin_ids:
+            if has_checkins:
                 try:
                     logger.info("deleting_project_checkins", project_id=project_id)
                     self.session.execute(
@@ -536,7 +808,7 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                     raise RepositoryError(f"Failed to delete checkins: {str(e)}") from e
             
             # 5. Delete sprint tasks linked to project sprints (Deep dependency)
-            if sprint_ids:
+            if has_sprints:
                 try:
                     logger.info("deleting_project_sprint_tasks", project_id=project_id)
                     self.session.execute(
@@ -548,7 +820,7 @@ class SQLAlchemyProjectRepository(IProjectRepository):
                     raise RepositoryError(f"Failed to delete sprint tasks: {str(e)}") from e
             
             # 6. Delete sprints (Direct dependency)
-            if sprint_ids:
+            if has_sprints:
                 try:
                     logger.info("deleting_project_sprints", project_id=project_id)
                     self.session.execute(
@@ -589,6 +861,8 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             logger.info("project_hard_deleted_success", project_id=project_id)
             return True
             
+        except ProjectAccessDeniedError:
+            raise
         except Exception as e:
             self.session.rollback()
             logger.error(
@@ -600,23 +874,129 @@ class SQLAlchemyProjectRepository(IProjectRepository):
             # Re-raise as RepositoryError to be handled by the service/controller
             raise RepositoryError(f"Failed to delete project: {str(e)}") from e
     
+    def bulk_transition(
+        self,
+        project_ids: List[int],
+        new_status: ProjectStatus,
+        allowed_from: Iterable[ProjectStatus],
+        owner_id: Optional[int] = None,
+        completion_date: Optional[date] = None
+    ) -> List[int]:
+        """Set-based status change: lock the eligible rows, one UPDATE, one commit.
+
+        MySQL has no UPDATE ... RETURNING, so eligible IDs come from a locking
+        SELECT in the same transaction; the UPDATE then touches exactly those.
+        version is bumped by hand (bulk UPDATEs bypass version_id_col) so
+        clients holding a stale version still get 409 on their next write.
+        """
+        from app.models.project import ProjectStatus as ORMProjectStatus
+        
+        if not project_ids:
+            return []
+        
+        try:
+            query = (
+                select(ORMProject.id)
+                .where(
+                    ORMProject.id.in_(project_ids),
+                    ORMProject.deleted_at.is_(None),
+                    ORMProject.status.in_([ORMProjectStatus(s.value) for s in allowed_from])
+                )
+                .with_for_update()
+            )
+            if owner_id is not None:
+                query = query.where(ORMProject.responsavel_id == owner_id)
+            
+            eligible = list(self.session.execute(query).scalars())
+            if not eligible:
+                self.session.rollback()
+                return []
+            
+            values = {
+                "status": ORMProjectStatus(new_status.value),
+                "version": ORMProject.version + 1,
+            }
+            if completion_date is not None:
+                values["data_fim_real"] = completion_date
+            
+            self.session.execute(
+                update(ORMProject)
+                .where(ORMProject.id.in_(eligible))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            self.session.commit()
+            
+            logger.info(
+                "projects_bulk_transitioned",
+                status=new_status.value,
+                requested=len(project_ids),
+                updated=len(eligible)
+            )
+            return eligible
+        except Exception as e:
+            self.session.rollback()
+            logger.error("project_bulk_transition_failed", status=new_status.value, error=str(e))
+            raise RepositoryError(f"Failed to update projects: {str(e)}") from e
+    
     def count_by_status(self, status: ProjectStatus) -> int:
         """Count projects in a status."""
         try:
             from app.models.project import ProjectStatus as ORMProjectStatus
             
-            return (
-                self.session.query(ORMProject)
-                .filter(
-                    ORMProject.status == ORMProjectStatus(status.value),
-                    ORMProject.deleted_at.is_(None)
-                )
-                .count()
-            )
+            return self._scalar_count(ORMProject, status=ORMProjectStatus(status.value))
         except Exception as e:
             logger.error("count_by_status_failed", status=status.value, error=str(e))
             raise RepositoryError(f"Failed to count projects: {str(e)}") from e
     
+    def status_summary(self, today: date) -> tuple[dict[ProjectStatus, int], int]:
+        """Per-status and overdue counts from one GROUP BY (no entity loads)."""
+        try:
+            from app.models.project import ProjectStatus as ORMProjectStatus
+            
+            overdue = case(
+                (ORMProject.data_fim_prevista < today, 1),
+                else_=0
+            )
+            rows = self.session.execute(
+                select(ORMProject.status, func.count(), func.sum(overdue))
+                .where(ORMProject.deleted_at.is_(None))
+                .group_by(ORMProject.status)
+            ).all()
+            
+            counts = {status: 0 for status in ProjectStatus}
+            total_overdue = 0
+            for orm_status, n, n_overdue in rows:
+                counts[ProjectStatus.parse(orm_status.value)] = n
+                if orm_status == ORMProjectStatus.EM_ANDAMENTO:
+                    total_overdue = int(n_overdue or 0)
+            return counts, total_overdue
+        except Exception as e:
+            logger.error("status_summary_failed", error=str(e))
+            raise RepositoryError(f"Failed to summarize projects: {str(e)}") from e
+    
+    def count(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
+    ) -> int:
+        """Count non-deleted projects matching the list filters (no eager loads)."""
+        try:
+            query = self._apply_filters(
+                self.session.query(func.count(ORMProject.id))
+                .filter(ORMProject.deleted_at.is_(None)),
+                status, client_id, responsible_id
+            )
+            return query.scalar() or 0
+        except Exception as e:
+            logger.error("project_count_failed", error=str(e))
+            raise RepositoryError(f"Failed to count projects: {str(e)}") from e
+    
     def exists(self, project_id: int) -> bool:
-        """Check if project exists."""
-        return self.get_by_id(project_id) is not None
+        """Check if project exists (one EXISTS query, nothing loaded)."""
+        try:
+            return self._scalar_exists(ORMProject, id=project_id)
+        except Exception as e:
+            logger.error("project_exists_failed", project_id=project_id, error=str(e))
+            raise RepositoryError(f"Failed to check project: {str(e)}") from e
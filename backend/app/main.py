@@ -1,16 +1,19 @@
 """
 FastAPI main application
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import os
 
 from app.core.config import settings
 from app.api.v1.router import api_router
 from app.core.middleware import RequestIDMiddleware
 from app.core.logging import get_logger
+from app.core.cache import close_redis_pool, init_redis
+from app.core.exceptions import register_exception_handlers
 
 # Import all models to ensure SQLAlchemy relationships are resolved
 from app.db import base  # noqa: F401
@@ -18,6 +21,15 @@ from app.db import base  # noqa: F401
 # Initialize structured logger
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Process-wide resources: probe Redis once at startup, release pooled connections on shutdown."""
+    await init_redis()
+    yield
+    await close_redis_pool()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.project_name,
@@ -25,9 +37,14 @@ app = FastAPI(
     description=settings.description,
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Domain errors (not found, invalid transition, ...) -> HTTP responses
+register_exception_handlers(app)
+
 # CORS middleware - configure allowed origins based on environment
 allowed_origins = settings.allowed_origins
 
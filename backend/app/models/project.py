@@ -1,9 +1,11 @@
 """
 Project model for project management
 """
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, ForeignKey, func, Table
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, ForeignKey, Index, and_, func, Table, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
+from datetime import date
 import enum
 
 
@@ -59,12 +61,34 @@ class Project(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     deleted_at = Column(DateTime(timezone=True))  # For soft delete
     
+    # Optimistic locking: every UPDATE is "... WHERE id=? AND version=?"
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     client = relationship("Client", back_populates="projetos")
     responsavel = relationship("User", back_populates="projetos")
     contributors = relationship("User", secondary=project_contributors, backref="contributed_projects")
     checkins = relationship("Checkin", back_populates="projeto")
     
+    __mapper_args__ = {"version_id_col": version}
+    
+    # List/overdue/per-client filters over live rows (partial on
+    # PostgreSQL; see migrations 7b1d4f2a9c60 and 5a9e3b7c2d18)
+    __table_args__ = (
+        Index(
+            "ix_projetos_live_status_cliente", "status", "cliente_id", "id",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_projetos_live_overdue", "status", "data_fim_prevista",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_projetos_live_cliente", "cliente_id", "id",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+    )
+    
     def __repr__(self):
         return f"<Project(id={self.id}, nome='{self.nome}', status='{self.status}')>"
     
@@ -78,6 +102,25 @@ class Project(Base):
         """Check if project is completed."""
         return self.status == ProjectStatus.CONCLUIDO
     
+    @hybrid_property
+    def is_overdue(self) -> bool:
+        """Check if project is active and past its planned end date."""
+        return (
+            self.is_active
+            and self.data_fim_prevista is not None
+            and self.data_fim_prevista < date.today()
+        )
+    
+    @is_overdue.expression
+    def is_overdue(cls):
+        # Same predicate as SQL, matching ix_projetos_live_overdue
+        # (status, data_fim_prevista WHERE deleted_at IS NULL)
+        return and_(
+            cls.status == ProjectStatus.EM_ANDAMENTO,
+            cls.data_fim_prevista < date.today(),
+            cls.deleted_at.is_(None)
+        )
+    
     @property
     def duration_days(self) -> int:
         """Calculate project duration in days."""
@@ -14,6 +14,19 @@ class UserRole(str, enum.Enum):
     SUPERVISOR = "supervisor"
 
 
+# Role bits for mask-based permission checks: a rule is a single
+# "role_flags & required_mask" instead of a chain of is_* comparisons.
+ROLE_ADMIN = 1
+ROLE_SUPERVISOR = 2
+ROLE_TECNICO = 4
+
+_ROLE_FLAGS = {
+    UserRole.ADMIN: ROLE_ADMIN,
+    UserRole.SUPERVISOR: ROLE_SUPERVISOR,
+    UserRole.TECNICO: ROLE_TECNICO,
+}
+
+
 class User(Base):
     """User model representing system users."""
     
@@ -44,6 +57,11 @@ class User(Base):
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', role='{self.role}')>"
     
+    @property
+    def role_flags(self) -> int:
+        """Role as a bit (ROLE_ADMIN / ROLE_SUPERVISOR / ROLE_TECNICO)."""
+        return _ROLE_FLAGS[self.role]
+    
     @property
     def is_admin(self) -> bool:
         """Check if user is admin."""
@@ -106,5 +106,5 @@ class CheckinResponse(BaseModel):
 
 class CheckinListResponse(BaseModel):
     items: List[CheckinResponse]
-    total: int
+    next_cursor: Optional[int] = None
 
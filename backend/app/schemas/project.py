@@ -8,7 +8,7 @@ Architecture Note:
 - Independent from ORM models (app.models.project)
 - Focused on API concerns: validation, serialization, documentation
 """
-from typing import Optional, List
+from typing import TYPE_CHECKING, Literal, Optional, List
 from datetime import date, datetime
 from pydantic import BaseModel, Field, field_validator
 
@@ -17,6 +17,9 @@ from app.domain.entities.project import ProjectStatus
 from app.schemas.client import ClientResponse
 from app.schemas.user import UserResponse
 
+if TYPE_CHECKING:
+    from app.domain.entities.project import Project
+
 
 class ContributorAddRequest(BaseModel):
     """Request DTO for adding a contributor."""
@@ -82,6 +85,9 @@ class ProjectUpdateRequest(BaseModel):
     end_date_planned: Optional[date] = None
     estimated_value: Optional[str] = Field(None, max_length=20)
     observations: Optional[str] = Field(None, max_length=5000)
+    version: Optional[int] = Field(
+        None, ge=0, description="Version the client last read; 409 if the project changed since"
+    )
     
     @field_validator('name')
     @classmethod
@@ -96,6 +102,27 @@ class ProjectStatusTransitionRequest(BaseModel):
     """Request DTO for project status transitions (start, pause, complete, cancel)."""
     completion_date: Optional[date] = Field(None, description="Actual completion date (for complete action)")
     cancellation_reason: Optional[str] = Field(None, max_length=500, description="Reason for cancellation")
+    version: Optional[int] = Field(
+        None, ge=0, description="Version the client last read; 409 if the project changed since"
+    )
+
+
+class ProjectBulkTransitionRequest(BaseModel):
+    """Request DTO for applying one status transition to many projects."""
+    project_ids: List[int] = Field(
+        ..., min_length=1, max_length=500, description="Projects to transition"
+    )
+    action: Literal["start", "pause", "complete", "cancel"] = Field(
+        ..., description="Transition to apply to every project"
+    )
+
+
+class ProjectBulkTransitionResponse(BaseModel):
+    """Response DTO for bulk transitions."""
+    updated: List[int] = Field(description="Projects moved to the new status")
+    skipped: List[int] = Field(
+        description="Projects not found, not allowed for this user, or in a state the action can't leave"
+    )
 
 
 class ProjectResponse(BaseModel):
@@ -140,6 +167,7 @@ class ProjectResponse(BaseModel):
     # Metadata
     created_at: datetime
     updated_at: Optional[datetime] = None
+    version: int = Field(0, description="Row version; echo it back on updates")
     
     model_config = {
         "from_attributes": True,
@@ -176,11 +204,72 @@ class ProjectResponse(BaseModel):
             duration_days=project.duration_days,
             created_at=project.created_at,
             updated_at=project.updated_at,
+            version=project.version,
             client=project.client,
             responsible_user=project.responsible_user,
             contributors=project.contributors
         )
 
+    @classmethod
+    def from_domain_fast(
+        cls,
+        project: 'Project',
+        nested: Optional[dict] = None
+    ) -> 'ProjectResponse':
+        """
+        Build the DTO from a trusted domain entity without re-validation.
+        
+        Every scalar already passed validation on its way out of the
+        database, so model_construct() just assigns attributes. Nested
+        ORM relations still go through their own DTOs (from_attributes);
+        pass the same ``nested`` dict across a list so each client/user is
+        converted once instead of once per project.
+        
+        Use on list hot paths; from_domain() stays the safe default.
+        """
+        nested = {} if nested is None else nested
+        
+        def dto(schema, obj):
+            key = (schema, obj.id)
+            if key not in nested:
+                nested[key] = schema.model_validate(obj)
+            return nested[key]
+        
+        return cls.model_construct(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            start_date=project.start_date,
+            end_date_planned=project.end_date_planned,
+            end_date_actual=project.end_date_actual,
+            status=project.status,
+            client_id=project.client_id,
+            responsible_user_id=project.responsible_user_id,
+            estimated_value=project.estimated_value,
+            observations=project.observations,
+            is_active=project.is_active,
+            is_overdue=project.is_overdue,
+            duration_days=project.duration_days,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            version=project.version,
+            client=dto(ClientResponse, project.client) if project.client else None,
+            responsible_user=(
+                dto(UserResponse, project.responsible_user)
+                if project.responsible_user else None
+            ),
+            contributors=(
+                [dto(UserResponse, u) for u in project.contributors]
+                if project.contributors is not None else None
+            )
+        )
+    
+    @classmethod
+    def from_domain_list(cls, projects: List['Project']) -> List['ProjectResponse']:
+        """from_domain_fast() over a page, sharing nested DTOs across rows."""
+        nested: dict = {}
+        return [cls.from_domain_fast(p, nested) for p in projects]
+
 
 class ProjectListResponse(BaseModel):
     """Response DTO for paginated project lists."""
@@ -188,6 +277,10 @@ class ProjectListResponse(BaseModel):
     total: int = Field(description="Total number of projects (for pagination)")
     skip: int = Field(description="Number of skipped items")
     limit: int = Field(description="Maximum items per page")
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="Pass as ?cursor= to fetch the next page by keyset (None on last page)"
+    )
 
 
 class ProjectStatisticsResponse(BaseModel):
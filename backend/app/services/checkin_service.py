@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
@@ -29,7 +29,9 @@ class CheckinService:
         )
         
         try:
-            return self.repository.create(checkin)
+            self.repository.create(checkin)
+            self.repository.commit(checkin)
+            return checkin
         except IntegrityError as e:
             # Check if it's a foreign key violation for project_id
             error_msg = str(e).lower()
@@ -73,10 +75,12 @@ class CheckinService:
         checkin.status = CheckinStatus.CONCLUIDO
         checkin.observacoes = full_observations
         
-        return self.repository.update(checkin)
+        self.repository.update(checkin)
+        self.repository.commit(checkin)
+        return checkin
 
     async def get_active_checkin(self, user_id: int) -> Optional[Checkin]:
-        return self.repository.get_active_by_user(user_id)
+        return self.repository.get_active_with_project(user_id)
 
     async def create_full_checkin(self, data: CheckinCreateFull) -> Checkin:
         # Calculate duration
@@ -99,7 +103,9 @@ class CheckinService:
         )
         
         try:
-            return self.repository.create(checkin)
+            self.repository.create(checkin)
+            self.repository.commit(checkin)
+            return checkin
         except IntegrityError as e:
             # Check if it's a foreign key violation for project_id
             error_msg = str(e).lower()
@@ -110,5 +116,9 @@ class CheckinService:
                 )
             raise e
 
-    async def get_history(self, skip: int = 0, limit: int = 100):
-        return self.repository.get_all(skip, limit)
+    async def get_history(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 10
+    ) -> Tuple[List[Checkin], Optional[int]]:
+        return self.repository.get_with_cursor(cursor, limit)
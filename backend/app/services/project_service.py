@@ -24,24 +24,30 @@ Architecture Pattern: Application Service (DDD)
 Performance Optimizations:
 - Cache-Aside pattern for read-heavy operations
 - Automatic cache invalidation on mutations
+- Repository calls run in a worker thread (asyncio.to_thread) so the
+  blocking SQLAlchemy session never stalls the event loop
 """
-from typing import List, Optional, Any
+import asyncio
+from typing import AsyncIterator, List, Optional, Any
 from datetime import date
 
 from app.domain.entities.project import (
     Project,
     ProjectStatus,
+    STATUS_TRANSITIONS,
     BusinessRuleViolationError,
     InvalidStateTransitionError
 )
 from app.domain.repositories.project_repository import (
+    ConcurrentModificationError,
     IProjectRepository,
     ProjectNotFoundError
 )
 from app.core.logging import get_logger
 from app.core.cache import (
-    CacheService,
+    get_cache_service,
     invalidate_project_cache,
+    invalidate_projects_cache,
     invalidate_projects_list_cache
 )
 
@@ -67,7 +73,7 @@ class ProjectService:
             project_repository: Repository abstraction (injected via DI)
         """
         self.repository = project_repository
-        self.cache = CacheService(namespace="projects", default_ttl=300)  # 5min TTL
+        self.cache = get_cache_service("projects", default_ttl=300)  # 5min TTL
     
     # ========================================
     # CRUD Operations
@@ -123,7 +129,7 @@ class ProjectService:
         )
         
         # Persist via repository
-        saved_project = self.repository.save(project)
+        saved_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate list caches (new project added)
         await invalidate_projects_list_cache()
@@ -139,12 +145,11 @@ class ProjectService:
     
     async def get_project(self, project_id: int) -> Project:
         """
-        Retrieve project by ID with caching.
+        Retrieve project by ID.
         
-        Cache Strategy:
-        - Cache key: "project:{id}"
-        - TTL: 5 minutes
-        - Invalidated on: update, delete, status change
+        Not cached here: the entity carries ORM relationships that the cache
+        codec cannot serialize. GET responses are cached at the route level
+        under "project:detail:{id}".
         
         Args:
             project_id: Unique identifier
@@ -155,35 +160,44 @@ class ProjectService:
         Raises:
             ProjectNotFoundError: If project doesn't exist
         """
-        # Try cache first (Cache-Aside pattern)
-        cache_key = f"project:{project_id}"
-        cached = await self.cache.get(cache_key)
-        
-        if cached:
-            logger.debug("project_cache_hit", project_id=project_id)
-            # Deserialize from dict back to domain entity
-            return Project(**cached)
-        
-        # Cache miss - fetch from DB
-        logger.debug("project_cache_miss", project_id=project_id)
-        project = self.repository.get_by_id(project_id)
+        project = await asyncio.to_thread(self.repository.get_by_id, project_id)
         
         if not project:
             raise ProjectNotFoundError(project_id)
         
-        # Store in cache (serialize domain entity to dict)
-        await self.cache.set(cache_key, project.__dict__, ttl=300)
+        return project
+    
+    async def _get_for_write(
+        self,
+        project_id: int,
+        expected_version: Optional[int] = None
+    ) -> Project:
+        """
+        Load a project for read-modify-write.
+        
+        If the caller echoed the version it last read, reject up front when
+        the project has moved on; either way repository.save() re-checks the
+        version atomically in its UPDATE.
+        
+        Raises:
+            ProjectNotFoundError: If project doesn't exist
+            ConcurrentModificationError: If expected_version is stale
+        """
+        project = await self.get_project(project_id)
+        
+        if expected_version is not None and project.version != expected_version:
+            raise ConcurrentModificationError(project_id)
         
         return project
     
-    def list_projects(
+    async def list_projects(
         self,
         skip: int = 0,
         limit: int = 100,
         status: Optional[ProjectStatus] = None,
         client_id: Optional[int] = None,
         responsible_id: Optional[int] = None
-    ) -> List[Project]:
+    ) -> tuple[List[Project], int]:
         """
         List projects with OFFSET pagination (legacy).
         
@@ -197,25 +211,52 @@ class ProjectService:
             responsible_id: Filter by responsible user (optional)
             
         Returns:
-            List of projects
+            Tuple of (projects, total) - one page plus the unpaged match count
         """
         # Enforce maximum limit for performance
         limit = min(limit, 100)
         
-        return self.repository.get_all(
-            skip=skip, 
-            limit=limit, 
-            status=status, 
+        def page() -> tuple[List[Project], int]:
+            projects = self.repository.get_all(
+                skip=skip,
+                limit=limit,
+                status=status,
+                client_id=client_id,
+                responsible_id=responsible_id
+            )
+            # Short page at offset 0 already is the full result set
+            if skip == 0 and len(projects) < limit:
+                return projects, len(projects)
+            total = self.repository.count(
+                status=status,
+                client_id=client_id,
+                responsible_id=responsible_id
+            )
+            return projects, total
+        
+        return await asyncio.to_thread(page)
+
+    async def count_projects(
+        self,
+        status: Optional[ProjectStatus] = None,
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
+    ) -> int:
+        """Count projects matching the list filters."""
+        return await asyncio.to_thread(
+            self.repository.count,
+            status=status,
             client_id=client_id,
             responsible_id=responsible_id
         )
 
-    def list_projects_cursor(
+    async def list_projects_cursor(
         self,
         cursor: Optional[int] = None,
         limit: int = 20,
         status: Optional[ProjectStatus] = None,
-        client_id: Optional[int] = None
+        client_id: Optional[int] = None,
+        responsible_id: Optional[int] = None
     ) -> tuple[List[Project], Optional[int]]:
         """
         List projects with CURSOR-BASED pagination (recommended for performance).
@@ -227,24 +268,27 @@ class ProjectService:
             limit: Page size (max 100)
             status: Filter by status
             client_id: Filter by client
+            responsible_id: Filter by responsible user (optional)
             
         Returns:
             Tuple of (projects, next_cursor)
         
         Example:
             # First page
-            projects, cursor = service.list_projects_cursor(limit=20)
+            projects, cursor = await service.list_projects_cursor(limit=20)
             
             # Next page  
-            projects, cursor = service.list_projects_cursor(cursor=cursor, limit=20)
+            projects, cursor = await service.list_projects_cursor(cursor=cursor, limit=20)
         """
         limit = min(limit, 100)
         
-        return self.repository.get_with_cursor(
+        return await asyncio.to_thread(
+            self.repository.get_with_cursor,
             cursor=cursor,
             limit=limit,
             status=status,
-            client_id=client_id
+            client_id=client_id,
+            responsible_id=responsible_id
         )
     
     async def update_project(
@@ -254,7 +298,8 @@ class ProjectService:
         description: Optional[str] = None,
         end_date_planned: Optional[date] = None,
         observations: Optional[str] = None,
-        estimated_value: Optional[str] = None
+        estimated_value: Optional[str] = None,
+        expected_version: Optional[int] = None
     ) -> Project:
         """
         Update project details with cache invalidation.
@@ -268,6 +313,7 @@ class ProjectService:
             end_date_planned: New planned end date (optional)
             observations: New observations (optional)
             estimated_value: New estimated value (optional)
+            expected_version: Version the caller last read (optional)
             
         Returns:
             Updated project
@@ -275,9 +321,10 @@ class ProjectService:
         Raises:
             ProjectNotFoundError: If project doesn't exist
             BusinessRuleViolationError: If trying to modify immutable project
+            ConcurrentModificationError: If the project changed since it was read
         """
-        # Retrieve existing project (will use cache if available)
-        project = await self.get_project(project_id)
+        # Retrieve existing project
+        project = await self._get_for_write(project_id, expected_version)
         
         # Use domain method to update (enforces business rules)
         project.update_details(
@@ -289,29 +336,36 @@ class ProjectService:
         )
         
         # Persist changes
-        updated_project = self.repository.save(project)
+        updated_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate caches (project changed)
-        await invalidate_project_cache(project_id)
-        await invalidate_projects_list_cache()
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
         logger.info("project_updated_via_service", project_id=project_id)
         
         return updated_project
     
-    async def delete_project(self, project_id: int, force: bool = False) -> bool:
+    async def delete_project(
+        self,
+        project_id: int,
+        force: bool = False,
+        owner_id: Optional[int] = None
+    ) -> bool:
         """
         Delete project with cache invalidation.
         If force=True, perform hard delete (physical removal).
         Else perform soft delete (if repository is configured that way).
         Currently repository.delete performs hard delete per requirements.
+        
+        owner_id restricts the delete to projects that user is responsible
+        for; the check is atomic with the delete (ProjectAccessDeniedError
+        otherwise).
         """
-        deleted = self.repository.delete(project_id)
+        deleted = await asyncio.to_thread(self.repository.delete, project_id, owner_id)
         
         if deleted:
             # Invalidate caches (project deleted)
-            await invalidate_project_cache(project_id)
-            await invalidate_projects_list_cache()
+            await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
             
             logger.info("project_deleted_via_service", project_id=project_id, force=force)
         
@@ -321,7 +375,11 @@ class ProjectService:
     # Business Operations (Workflows)
     # ========================================
     
-    async def start_project(self, project_id: int) -> Project:
+    async def start_project(
+        self,
+        project_id: int,
+        expected_version: Optional[int] = None
+    ) -> Project:
         """
         Start a project (transition to EM_ANDAMENTO) with cache invalidation.
         
@@ -337,17 +395,16 @@ class ProjectService:
             ProjectNotFoundError: If project doesn't exist
             InvalidStateTransitionError: If cannot start from current state
         """
-        project = await self.get_project(project_id)
+        project = await self._get_for_write(project_id, expected_version)
         
         # Domain entity enforces state transition rules
         project.start()
         
         # Persist state change
-        updated_project = self.repository.save(project)
+        updated_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate caches (status changed)
-        await invalidate_project_cache(project_id)
-        await invalidate_projects_list_cache()
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
         logger.info(
             "project_started",
@@ -357,20 +414,23 @@ class ProjectService:
         
         return updated_project
     
-    async def pause_project(self, project_id: int) -> Project:
+    async def pause_project(
+        self,
+        project_id: int,
+        expected_version: Optional[int] = None
+    ) -> Project:
         """
         Pause an active project with cache invalidation.
         
         Business Rule: Can only pause active projects.
         """
-        project = await self.get_project(project_id)
+        project = await self._get_for_write(project_id, expected_version)
         project.pause()
         
-        updated_project = self.repository.save(project)
+        updated_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate caches (status changed)
-        await invalidate_project_cache(project_id)
-        await invalidate_projects_list_cache()
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
         logger.info("project_paused", project_id=project_id)
         
@@ -379,7 +439,8 @@ class ProjectService:
     async def complete_project(
         self,
         project_id: int,
-        completion_date: Optional[date] = None
+        completion_date: Optional[date] = None,
+        expected_version: Optional[int] = None
     ) -> Project:
         """
         Mark project as completed with cache invalidation.
@@ -393,14 +454,13 @@ class ProjectService:
         Returns:
             Completed project
         """
-        project = await self.get_project(project_id)
+        project = await self._get_for_write(project_id, expected_version)
         project.complete(completion_date)
         
-        updated_project = self.repository.save(project)
+        updated_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate caches (status changed + completion date set)
-        await invalidate_project_cache(project_id)
-        await invalidate_projects_list_cache()
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
         logger.info(
             "project_completed",
@@ -410,7 +470,12 @@ class ProjectService:
         
         return updated_project
     
-    async def cancel_project(self, project_id: int, reason: Optional[str] = None) -> Project:
+    async def cancel_project(
+        self,
+        project_id: int,
+        reason: Optional[str] = None,
+        expected_version: Optional[int] = None
+    ) -> Project:
         """
         Cancel project with cache invalidation.
         
@@ -423,42 +488,106 @@ class ProjectService:
         Returns:
             Cancelled project
         """
-        project = await self.get_project(project_id)
+        project = await self._get_for_write(project_id, expected_version)
         project.cancel(reason)
         
-        updated_project = self.repository.save(project)
+        updated_project = await asyncio.to_thread(self.repository.save, project)
         
         # Invalidate caches (status changed)
-        await invalidate_project_cache(project_id)
-        await invalidate_projects_list_cache()
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
         logger.info("project_cancelled", project_id=project_id, reason=reason or "Not specified")
         
         return updated_project
     
+    async def bulk_transition(
+        self,
+        project_ids: List[int],
+        action: str,
+        owner_id: Optional[int] = None
+    ) -> tuple[List[int], List[int]]:
+        """
+        Apply one status transition to many projects in a single transaction.
+        
+        Same state rules as start/pause/complete/cancel_project (see
+        STATUS_TRANSITIONS), but checked set-wise in the database instead of
+        loading each entity. Projects that don't exist, are in a state the
+        action can't leave, or (with owner_id) belong to someone else are
+        skipped rather than failing the whole batch.
+        
+        Args:
+            project_ids: Projects to transition (duplicates ignored)
+            action: "start", "pause", "complete" or "cancel"
+            owner_id: Restrict to projects this user is responsible for
+            
+        Returns:
+            (updated IDs, skipped IDs)
+        """
+        new_status, allowed_from = STATUS_TRANSITIONS[action]
+        project_ids = list(dict.fromkeys(project_ids))
+        completion_date = date.today() if new_status == ProjectStatus.CONCLUIDO else None
+        
+        updated = await asyncio.to_thread(
+            self.repository.bulk_transition,
+            project_ids, new_status, allowed_from, owner_id, completion_date
+        )
+        
+        if updated:
+            # One round of invalidation for the whole batch
+            await asyncio.gather(invalidate_projects_cache(updated), invalidate_projects_list_cache())
+        
+        done = set(updated)
+        skipped = [pid for pid in project_ids if pid not in done]
+        
+        logger.info(
+            "projects_bulk_transition",
+            action=action,
+            updated=len(updated),
+            skipped=len(skipped)
+        )
+        
+        return updated, skipped
+    
     # ========================================
     # Query Operations (Reports/Analytics)
     # ========================================
     
-    def get_active_projects(self) -> List[Project]:
+    async def get_active_projects(self) -> List[Project]:
         """
         Get all currently active projects.
         
         Returns:
             List of active projects
         """
-        return self.repository.get_active_projects()
+        return await asyncio.to_thread(self.repository.get_active_projects)
     
-    def get_overdue_projects(self) -> List[Project]:
+    async def get_overdue_projects(self) -> List[Project]:
         """
         Get projects that are past their deadline.
         
         Returns:
             List of overdue projects
         """
-        return self.repository.get_overdue_projects()
+        return await asyncio.to_thread(self.repository.get_overdue_projects)
+    
+    async def stream_overdue_projects(self, batch_size: int = 100) -> AsyncIterator[List[Project]]:
+        """
+        Overdue projects in batches, each fetched in a worker thread.
+        
+        For streaming responses: memory stays bounded by batch_size no
+        matter how large the backlog is.
+        """
+        batches = self.repository.iter_overdue_projects(batch_size)
+        try:
+            while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+                yield batch
+        finally:
+            # Closed inline, not via to_thread: on a client disconnect this
+            # runs under cancellation, and an await here would be cancelled
+            # before the generator released its session
+            batches.close()
     
-    def get_client_projects(self, client_id: int) -> List[Project]:
+    async def get_client_projects(self, client_id: int) -> List[Project]:
         """
         Get all projects for a specific client.
         
@@ -468,21 +597,26 @@ class ProjectService:
         Returns:
             List of client's projects
         """
-        return self.repository.get_by_client(client_id)
+        return await asyncio.to_thread(self.repository.get_by_client, client_id)
 
-    def add_contributor(self, project_id: int, user_id: int) -> None:
+    async def add_contributor(self, project_id: int, user_id: int) -> None:
         """Add a contributor to a project."""
-        self.repository.add_contributor(project_id, user_id)
+        await asyncio.to_thread(self.repository.add_contributor, project_id, user_id)
         
-    def remove_contributor(self, project_id: int, user_id: int) -> None:
+        # Contributors appear in list payloads and widen tecnico list filters
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
+        
+    async def remove_contributor(self, project_id: int, user_id: int) -> None:
         """Remove a contributor from a project."""
-        self.repository.remove_contributor(project_id, user_id)
+        await asyncio.to_thread(self.repository.remove_contributor, project_id, user_id)
+        
+        await asyncio.gather(invalidate_project_cache(project_id), invalidate_projects_list_cache())
         
-    def get_contributors(self, project_id: int) -> List[Any]:
+    async def get_contributors(self, project_id: int) -> List[Any]:
         """Get contributors for a project."""
-        return self.repository.get_contributors(project_id)
+        return await asyncio.to_thread(self.repository.get_contributors, project_id)
     
-    def get_project_statistics(self) -> dict:
+    async def get_project_statistics(self) -> dict:
         """
         Get project statistics across all statuses.
         
@@ -491,13 +625,15 @@ class ProjectService:
             
         Use Case: Dashboard widgets, reports
         """
-        stats = {}
-        
-        for status in ProjectStatus:
-            stats[status.value] = self.repository.count_by_status(status)
+        # One aggregate query instead of a count per status plus loading
+        # every active/overdue project just to len() it
+        counts, total_overdue = await asyncio.to_thread(
+            self.repository.status_summary, date.today()
+        )
         
-        stats["total_active"] = len(self.repository.get_active_projects())
-        stats["total_overdue"] = len(self.repository.get_overdue_projects())
+        stats = {status.value: n for status, n in counts.items()}
+        stats["total_active"] = counts[ProjectStatus.EM_ANDAMENTO]
+        stats["total_overdue"] = total_overdue
         
         logger.info("project_statistics_generated", stats=stats)
         
@@ -23,7 +23,7 @@ async def install_requirements():
         "pydantic[email]==2.5.0",
         "pydantic-settings==2.1.0",
         "passlib[bcrypt]==1.7.4",
-        "python-jose[cryptography]==3.3.0",
+        "PyJWT==2.9.0",
         "python-multipart==0.0.6",
     ]
     
@@ -38,7 +38,7 @@ export const DataProvider = ({ children }: { children: ReactNode }) => {
     try {
       const [projectsData, checkinsData] = await Promise.all([
         projectService.getAll(),
-        checkinService.getHistory(1, 100)
+        checkinService.getHistory(100)
       ])
 
       // Use mappers to transform API data to domain models
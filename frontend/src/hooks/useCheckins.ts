@@ -21,8 +21,8 @@ import toast from 'react-hot-toast'
 export const checkinKeys = {
   all: ['checkins'] as const,
   lists: () => [...checkinKeys.all, 'list'] as const,
-  list: (page?: number, limit?: number) => 
-    [...checkinKeys.lists(), { page, limit }] as const,
+  list: (cursor?: number | null, limit?: number) => 
+    [...checkinKeys.lists(), { cursor, limit }] as const,
   byProject: (projectId: string) => 
     [...checkinKeys.all, 'project', projectId] as const,
   active: () => [...checkinKeys.all, 'active'] as const
@@ -124,15 +124,15 @@ export function useStopCheckin() {
 /**
  * Fetch checkin history with pagination
  */
-export function useCheckins(page: number = 1, limit: number = 20) {
+export function useCheckins(limit: number = 20, cursor?: number | null) {
   return useQuery({
-    queryKey: checkinKeys.list(page, limit),
+    queryKey: checkinKeys.list(cursor, limit),
     queryFn: async (): Promise<Checkin[]> => {
       try {
-        const response = await checkinService.getHistory(page, limit)
+        const response = await checkinService.getHistory(limit, cursor)
         return CheckinMapper.toDomainList(response.items)
       } catch (error) {
-        logger.error('Failed to fetch checkins', error as Error, { page, limit })
+        logger.error('Failed to fetch checkins', error as Error, { cursor, limit })
         throw error
       }
     },
@@ -151,7 +151,7 @@ export function useProjectCheckins(projectId: string) {
     queryFn: async (): Promise<Checkin[]> => {
       try {
         // Assuming API supports filtering by project
-        const response = await checkinService.getHistory(1, 100)
+        const response = await checkinService.getHistory(100)
         const allCheckins = CheckinMapper.toDomainList(response.items)
         return allCheckins.filter(c => c.projectId === projectId)
       } catch (error) {
@@ -80,7 +80,7 @@ import {
 class ProjectService {
   async getAll(): Promise<Project[]> {
     const response = await api.get('/projects/')
-    return response.data
+    return response.data.items
   }
 
   async getById(id: number): Promise<Project> {
@@ -221,9 +221,9 @@ class CheckinService {
   }
 
   // Histórico de check-ins
-  async getHistory(page: number = 1, size: number = 10): Promise<{ items: Checkin[], total: number }> {
+  async getHistory(size: number = 10, cursor?: number | null): Promise<{ items: Checkin[], next_cursor: number | null }> {
     const response = await api.get(`/checkins/`, {
-      params: { page, size }
+      params: { size, cursor: cursor ?? undefined }
     })
     return response.data
   }
@@ -22,6 +22,7 @@ export interface Project {
   client?: Client
   responsible_user?: User
   contributors?: User[]
+  version?: number
 }
 
 export interface Task {